@@ -118,6 +118,25 @@ def serve_dashboard():
     except Exception as e:
         return jsonify({"error": f"Error sirviendo dashboard: {str(e)}"}), 500
 
+@app.route("/dashboard_data.bin.gz")
+def serve_dashboard_data():
+    try:
+        if not os.path.exists("dashboard_data.bin.gz"):
+            return jsonify({
+                "error": "❌ Aún no se han generado los datos del dashboard.",
+                "suggestion": "Usa el endpoint /generate primero"
+            }), 404
+        # The client decompresses with DecompressionStream, so this is a
+        # plain binary download (no Content-Encoding)
+        return send_file(
+            "dashboard_data.bin.gz",
+            mimetype='application/octet-stream',
+            as_attachment=False,
+            download_name='dashboard_data.bin.gz'
+        )
+    except Exception as e:
+        return jsonify({"error": f"Error sirviendo datos: {str(e)}"}), 500
+
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({"error": "Endpoint no encontrado"}), 404
@@ -1,39 +1,146 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import json
+import gzip
+import hashlib
+import orjson
 import os
 
 EXCEL_FILE = 'Export Jira CSRs 1.xlsx'
 HTML_FILE = 'dashboard.html'
+DATA_FILE = 'dashboard_data.bin.gz'
+CACHE_DIR = '.cache'
+# Bump whenever the generated HTML/sidecar format changes, so existing
+# outputs built from the same Excel file are regenerated anyway
+SCHEMA_VERSION = 4
+
+# Column type map for the Jira export, applied at read time
+DATE_COLS = [
+    'Creada',
+    'Actualizada',
+    'Latest Transition to Listo',
+    'Fecha Planificada de Liberación',
+    'Fecha Real de Liberación'
+]
+NUMERIC_COLS = [
+    'Liberación retrasada por',
+    'Estado Desarrollo > 30 días',
+    'Desarrollo y liberada > 60 Días'
+]
+CATEGORICAL_COLS = ['Estado', 'Pr', 'T', 'Persona asignada', 'Desarrollador']
+# Layout Jira uses for text-stored timestamps in this export (day-first)
+DATE_FORMAT = '%d/%m/%y %H:%M'
 
 # =============== DATA PROCESSING ===============
 
+def _cache_path():
+    """
+    Returns the parquet cache path for the current Excel file, keyed on its
+    mtime and size so the cache is invalidated whenever the source changes.
+    """
+    key = (os.path.getmtime(EXCEL_FILE), os.path.getsize(EXCEL_FILE))
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f'{digest}.parquet')
+
+
+def _first_sheet_part(zf):
+    """
+    Resolves the workbook's first sheet (pandas' sheet_name=0) to its
+    worksheet part via xl/workbook.xml and the workbook rels: part names
+    like sheetN.xml need not follow workbook sheet order, so a name sort
+    could pick the wrong sheet on a multi-sheet export.
+    """
+    from xml.etree.ElementTree import fromstring
+
+    r_id_attr = ('{http://schemas.openxmlformats.org/officeDocument'
+                 '/2006/relationships}id')
+    try:
+        workbook = fromstring(zf.read('xl/workbook.xml'))
+        first = next(el for el in workbook.iter() if el.tag.endswith('}sheet'))
+        rels = fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+        target = next(rel.get('Target') for rel in rels
+                      if rel.get('Id') == first.get(r_id_attr))
+        # Targets are workbook-relative ('worksheets/sheet1.xml') or,
+        # rarely, package-absolute ('/xl/worksheets/sheet1.xml')
+        part = target.lstrip('/')
+        return part if part.startswith('xl/') else 'xl/' + part
+    except (KeyError, StopIteration):
+        return None
+
+
+def _hidden_rows():
+    """
+    Returns the set of hidden Excel row numbers in the first worksheet.
+    Streams the worksheet XML directly (no openpyxl DOM load) so the cost
+    is one SAX-style pass instead of materializing every cell.
+    """
+    import zipfile
+    from xml.etree.ElementTree import iterparse
+
+    hidden = set()
+    with zipfile.ZipFile(EXCEL_FILE) as zf:
+        sheet_part = _first_sheet_part(zf)
+        if sheet_part is None or sheet_part not in zf.namelist():
+            return hidden
+        with zf.open(sheet_part) as xml:
+            for _, elem in iterparse(xml):
+                if elem.tag.endswith('}row'):
+                    if elem.get('hidden') == '1' or elem.get('hidden') == 'true':
+                        hidden.add(int(elem.get('r')))
+                    elem.clear()  # Keep memory flat while streaming
+    return hidden
+
+
 def load_data():
     """
     Loads data from the specified Excel file, excluding hidden rows.
     Standardizes column names by stripping whitespace.
+    Caches the loaded DataFrame as parquet keyed on the workbook's
+    mtime+size, so unchanged files skip the expensive Excel parse.
     """
     try:
-        # 1. Load the data with pandas
-        df = pd.read_excel(EXCEL_FILE)
+        # 0. Return the cached snapshot if the source file is unchanged
+        cache_file = _cache_path()
+        if os.path.exists(cache_file):
+            try:
+                return pd.read_parquet(cache_file)
+            except Exception as e:
+                print(f"Warning: could not read cache '{cache_file}': {e}. Reparsing Excel.")
+
+        # 1. Load the data with pandas (calamine parses XLSX several times
+        # faster than the default openpyxl engine and returns typed columns).
+        # Text-stored date columns are parsed in preprocess_data with an
+        # explicit format; parse_dates would fall back to per-element
+        # dateutil inference, which is slow and guesses month-first.
+        df = pd.read_excel(EXCEL_FILE, engine='calamine', sheet_name=0)
         df.columns = [col.strip() for col in df.columns]
 
-        # 2. Filter for visible rows using openpyxl
-        import openpyxl
-        wb = openpyxl.load_workbook(EXCEL_FILE, data_only=True)
-        sheet = wb.active  # Or wb['Sheet Name'] if you have a specific sheet
-
-        # Collect Excel row numbers that are visible (not hidden)
-        visible_rows = [
-            row[0].row for row in sheet.iter_rows()
-            if not sheet.row_dimensions[row[0].row].hidden
-        ]
-        # Adjust for pandas zero-based index (Excel row 1 = header), skip header
-        visible_indices = [i - 2 for i in visible_rows if i > 1]
-
-        # 3. Filter the DataFrame to only include visible rows
-        df = df.iloc[visible_indices].reset_index(drop=True)
+        # 2. Filter for visible rows (single streaming pass over the sheet
+        # XML instead of a full openpyxl DOM load just to read row flags)
+        hidden_rows = _hidden_rows()
+
+        # 3. Filter the DataFrame to only include visible rows. A boolean
+        # mask avoids building an index list and pandas' fancy-indexing
+        # path; the Excel row numbers are shifted and clipped in one
+        # vectorized step (Excel row 1 = header, so pandas index = row - 2)
+        mask = np.ones(len(df), dtype=bool)
+        if hidden_rows:
+            idx = np.fromiter(hidden_rows, dtype=np.int64) - 2
+            mask[idx[(idx >= 0) & (idx < len(df))]] = False
+        df = df[mask].reset_index(drop=True)
+
+        # 4. Persist a parquet snapshot so the next run with an unchanged
+        # source file can skip the Excel parse entirely
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Drop snapshots of older versions of the file before writing
+            for stale in os.listdir(CACHE_DIR):
+                if stale.endswith('.parquet'):
+                    os.remove(os.path.join(CACHE_DIR, stale))
+            df.to_parquet(cache_file, engine='pyarrow', compression='zstd')
+        except Exception as e:
+            print(f"Warning: could not write cache '{cache_file}': {e}")
+
         return df
 
     except FileNotFoundError:
@@ -44,6 +151,18 @@ def load_data():
         exit()
 
 
+def _parse_date_column(s):
+    """
+    Parses a date Series with the export's known format (C fast path,
+    cache=True dedupes repeated timestamps). If the layout ever changes and
+    nothing matches, falls back to pandas' format inference.
+    """
+    parsed = pd.to_datetime(s, format=DATE_FORMAT, errors='coerce', cache=True)
+    if parsed.isna().all() and s.notna().any():
+        parsed = pd.to_datetime(s, errors='coerce', cache=True)
+    return parsed
+
+
 def preprocess_data(df):
     """
     Preprocesses the DataFrame:
@@ -51,30 +170,29 @@ def preprocess_data(df):
     - Converts specified numeric columns to numeric types, coercing errors.
     - Calculates 'Liberación retrasada por' (delay in days) if not already present.
     """
-    # Convert date columns to datetime objects
-    date_cols = [
-        'Creada',
-        'Actualizada',
-        'Latest Transition to Listo',
-        'Fecha Planificada de Liberación',
-        'Fecha Real de Liberación'
-    ]
-    for col in date_cols:
-        if col in df.columns:
-            # Using errors='coerce' will turn invalid date formats into NaT (Not a Time)
-            df[col] = pd.to_datetime(df[col], errors='coerce')
-
-    # Force numeric conversion for duration/delay columns, coerce errors to NaN
-    numeric_cols = [
-        'Liberación retrasada por',
-        'Estado Desarrollo > 30 días',
-        'Desarrollo y liberada > 60 Días'
-    ]
-    for col in numeric_cols:
-        if col in df.columns:
+    # Convert date columns to datetime objects. Most arrive typed from
+    # calamine — the dtype guard makes those a no-op instead of an O(n)
+    # copy; text-stored ones (e.g. 'Latest Transition to Listo') are
+    # parsed with the explicit day-first format
+    for col in DATE_COLS:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = _parse_date_column(df[col])
+
+    # Force numeric conversion for duration/delay columns, coerce errors to NaN.
+    # These can't be typed at read time because the export mixes in status
+    # strings (e.g. 'ON-TRACK') that must coerce to NaN rather than raise.
+    # Already-numeric columns (e.g. from the parquet cache) skip the pass.
+    for col in NUMERIC_COLS:
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
             # Using errors='coerce' will turn non-numeric values into NaN
             df[col] = pd.to_numeric(df[col], errors='coerce')
 
+    # Low-cardinality string columns become categoricals: value_counts then
+    # runs on integer codes (bincount) and groupby skips string hashing
+    for col in CATEGORICAL_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
     # Calculate 'Liberación retrasada por' if it's missing or all NaN
     # This ensures the metric is always available for analysis
     if 'Liberación retrasada por' not in df.columns or df['Liberación retrasada por'].isnull().all():
@@ -97,65 +215,86 @@ def get_metrics(df):
     """
     # --- KPIs ---
     total_csrs = len(df)
-    # Safely calculate mean, handling inf/-inf and NaN values
-    avg_delay = df['Liberación retrasada por'].replace([np.inf, -np.inf], np.nan).dropna().mean()
-    # Calculate percentage of late releases (delay > 0)
-    pct_late = (df['Liberación retrasada por'] > 0).mean() * 100 if total_csrs > 0 else 0
-
-    avg_dev_gt30 = df['Estado Desarrollo > 30 días'].replace([np.inf, -np.inf], np.nan).dropna().mean()
-    num_dev_gt30 = (df['Estado Desarrollo > 30 días'] > 0).sum()
-
-    avg_devlib_gt60 = df['Desarrollo y liberada > 60 Días'].replace([np.inf, -np.inf], np.nan).dropna().mean()
-    num_devlib_gt60 = (df['Desarrollo y liberada > 60 Días'] > 0).sum()
-
-    max_delay = df['Liberación retrasada por'].max()
-    valid_min_values = df['Liberación retrasada por'][df['Liberación retrasada por'] > 0].dropna()
-    min_delay = valid_min_values.min() if not valid_min_values.empty else 0.0
+    # Pull each numeric column's ndarray once and derive every aggregate
+    # from it, instead of repeated replace/dropna chains per KPI
+    delay = df['Liberación retrasada por'].to_numpy(dtype='float64')
+    finite_delay = delay[np.isfinite(delay)]
+    avg_delay = float(finite_delay.mean()) if finite_delay.size else 0.0
+    # Percentage of late releases (delay > 0); NaN compares False, matching
+    # the previous Series semantics
+    pct_late = (delay > 0).mean() * 100 if total_csrs > 0 else 0
+    max_delay = float(finite_delay.max()) if finite_delay.size else 0.0
+    positive_delay = finite_delay[finite_delay > 0]
+    min_delay = float(positive_delay.min()) if positive_delay.size else 0.0
+
+    dev_gt30 = df['Estado Desarrollo > 30 días'].to_numpy(dtype='float64')
+    finite_dev_gt30 = dev_gt30[np.isfinite(dev_gt30)]
+    avg_dev_gt30 = float(finite_dev_gt30.mean()) if finite_dev_gt30.size else 0.0
+    num_dev_gt30 = int((dev_gt30 > 0).sum())
+
+    devlib_gt60 = df['Desarrollo y liberada > 60 Días'].to_numpy(dtype='float64')
+    finite_devlib_gt60 = devlib_gt60[np.isfinite(devlib_gt60)]
+    avg_devlib_gt60 = float(finite_devlib_gt60.mean()) if finite_devlib_gt60.size else 0.0
+    num_devlib_gt60 = int((devlib_gt60 > 0).sum())
 
 
     # --- Grouped data (value counts for categorical columns) ---
     by_estado = df['Estado'].value_counts().to_dict() if 'Estado' in df.columns else {}
     by_pr = df['Pr'].value_counts().to_dict() if 'Pr' in df.columns else {}
     by_tipo = df['T'].value_counts().to_dict() if 'T' in df.columns else {}
-    by_persona = df['Persona asignada'].value_counts().to_dict() if 'Persona asignada' in df.columns else {}
-    by_dev = df['Desarrollador'].value_counts().to_dict() if 'Desarrollador' in df.columns else {}
 
-    # Delays per person/dev
-    # Using .fillna(0) before mean to include cases where there are no delays for a person/dev
-    delay_by_persona = df.groupby('Persona asignada')['Liberación retrasada por'].mean().sort_values(ascending=False).to_dict() if 'Persona asignada' in df.columns else {}
-    delay_by_dev = df.groupby('Desarrollador')['Liberación retrasada por'].mean().sort_values(ascending=False).to_dict() if 'Desarrollador' in df.columns else {}
+    # Counts and mean delay per person/dev come out of one groupby pass
+    # each, instead of a separate value_counts plus groupby.mean that each
+    # rebuild the group indexer
+    def _count_and_mean_delay(col):
+        if col not in df.columns:
+            return {}, {}
+        # Groups arrive in category order (sort=True); the stable value
+        # sort then breaks ties in category order too, so the ordering is
+        # deterministic and matches the client-side aggregation, which
+        # walks the dictionary in category order before its stable sort
+        agg = df.groupby(col, observed=True)['Liberación retrasada por'].agg(['size', 'mean'])
+        counts = agg['size'].sort_values(ascending=False, kind='stable').to_dict()
+        # No-delay groups mean NaN and display as 0; sorting them as 0
+        # keeps their position identical to the client's
+        means = agg['mean'].fillna(0.0).sort_values(ascending=False, kind='stable').to_dict()
+        return counts, means
+
+    by_persona, delay_by_persona = _count_and_mean_delay('Persona asignada')
+    by_dev, delay_by_dev = _count_and_mean_delay('Desarrollador')
 
 
     # --- Time series ---
-    # Ensure 'Creada' column exists before attempting to create 'Creada_week'
-    if 'Creada' in df.columns and not df['Creada'].isnull().all():
-        df['Creada_week'] = df['Creada'].dt.to_period('W').astype(str)
-        created_trend = df.groupby('Creada_week').size().to_dict()
-    else:
-        created_trend = {}
-
-    # Ensure 'Fecha Real de Liberación' column exists before attempting to group
-    if 'Fecha Real de Liberación' in df.columns and not df['Fecha Real de Liberación'].isnull().all():
-        resolved_trend = df.groupby(df['Fecha Real de Liberación'].dt.to_period('W').astype(str)).size().to_dict()
-    else:
-        resolved_trend = {}
+    # Group directly on the datetime64 column with a weekly Grouper: integer
+    # bucket arithmetic instead of materializing per-row Period objects and
+    # week-label strings, and no helper column left behind on the frame
+    def _weekly_trend(col):
+        if col not in df.columns or df[col].isnull().all():
+            return {}
+        trend = df.groupby(pd.Grouper(key=col, freq='W')).size()
+        trend.index = trend.index.strftime('%G-W%V')
+        return trend.to_dict()
+
+    created_trend = _weekly_trend('Creada')
+    resolved_trend = _weekly_trend('Fecha Real de Liberación')
 
     # --- Outliers (Top 10) ---
-    # Ensure columns exist and handle cases where dataframe might be empty or column has all NaNs
-    top_late = df.sort_values('Liberación retrasada por', ascending=False).head(10) if 'Liberación retrasada por' in df.columns and not df['Liberación retrasada por'].isnull().all() else pd.DataFrame()
-    top_dev_gt30 = df.sort_values('Estado Desarrollo > 30 días', ascending=False).head(10) if 'Estado Desarrollo > 30 días' in df.columns and not df['Estado Desarrollo > 30 días'].isnull().all() else pd.DataFrame()
-    top_devlib_gt60 = df.sort_values('Desarrollo y liberada > 60 Días', ascending=False).head(10) if 'Desarrollo y liberada > 60 Días' in df.columns and not df['Desarrollo y liberada > 60 Días'].isnull().all() else pd.DataFrame()
+    # nlargest does a partial selection (O(n) for 10 rows) instead of
+    # sorting the whole frame; same column-presence guards as before
+    top_late = df.nlargest(10, 'Liberación retrasada por') if 'Liberación retrasada por' in df.columns and not df['Liberación retrasada por'].isnull().all() else pd.DataFrame()
+    top_dev_gt30 = df.nlargest(10, 'Estado Desarrollo > 30 días') if 'Estado Desarrollo > 30 días' in df.columns and not df['Estado Desarrollo > 30 días'].isnull().all() else pd.DataFrame()
+    top_devlib_gt60 = df.nlargest(10, 'Desarrollo y liberada > 60 Días') if 'Desarrollo y liberada > 60 Días' in df.columns and not df['Desarrollo y liberada > 60 Días'].isnull().all() else pd.DataFrame()
 
     return dict(
         total_csrs=total_csrs,
-        avg_delay=avg_delay if not pd.isna(avg_delay) else 0.0, # Handle NaN for display
+        avg_delay=avg_delay,
         pct_late=pct_late,
-        avg_dev_gt30=avg_dev_gt30 if not pd.isna(avg_dev_gt30) else 0.0,
+        avg_dev_gt30=avg_dev_gt30,
         num_dev_gt30=num_dev_gt30,
-        avg_devlib_gt60=avg_devlib_gt60 if not pd.isna(avg_devlib_gt60) else 0.0,
+        avg_devlib_gt60=avg_devlib_gt60,
         num_devlib_gt60=num_devlib_gt60,
-        max_delay=max_delay if not pd.isna(max_delay) else 0.0,
-        min_delay=min_delay if not pd.isna(min_delay) else 0.0,
+        max_delay=max_delay,
+        min_delay=min_delay,
         by_estado=by_estado,
         by_pr=by_pr,
         by_tipo=by_tipo,
@@ -176,146 +315,10 @@ def html_escape(s):
     """Escapes HTML special characters in a string."""
     return str(s).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;').replace("'", '&#039;')
 
-def render_dashboard(df, metrics):
-    """
-    Renders the HTML dashboard using the calculated metrics.
-    Includes sections for KPIs, charts (using Plotly.js), and tables for outliers.
-    Adds filter dropdowns and client-side JavaScript for interactivity.
-    """
-    now = datetime.now().strftime('%Y-%m-%d %H:%M')
-
-    # Convert DataFrame to JSON for client-side filtering
-    df_json_serializable = df.copy()
-    for col in df.columns:
-        if pd.api.types.is_datetime64_any_dtype(df_json_serializable[col]):
-            df_json_serializable[col] = df_json_serializable[col].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('')
-        elif pd.api.types.is_numeric_dtype(df_json_serializable[col]):
-            df_json_serializable[col] = df_json_serializable[col].replace([np.inf, -np.inf], np.nan).fillna(0) # Handle inf and NaN
-        elif pd.api.types.is_bool_dtype(df_json_serializable[col]):
-            df_json_serializable[col] = df_json_serializable[col].astype(str) # Convert booleans to string
-    
-    # Ensure all string columns are correctly encoded for JSON and handle NaN
-    for col in df_json_serializable.select_dtypes(include='object').columns:
-        df_json_serializable[col] = df_json_serializable[col].apply(lambda x: html_escape(x) if pd.notna(x) else '') # Use html_escape here for safety when embedding directly
-
-    # Now, convert to dictionary of records for JSON serialization
-    full_data_dict = df_json_serializable.to_dict(orient='records')
-    # Use json.dumps for the entire dataset to embed directly into JavaScript
-    full_data_json_str = json.dumps(full_data_dict)
-
-    # Extract unique values for filter dropdowns
-    filter_options = {
-        'Estado': sorted(df['Estado'].dropna().unique().tolist()) if 'Estado' in df.columns else [],
-        'Pr': sorted(df['Pr'].dropna().unique().tolist()) if 'Pr' in df.columns else [],
-        'T': sorted(df['T'].dropna().unique().tolist()) if 'T' in df.columns else [],
-        'Persona asignada': sorted(df['Persona asignada'].dropna().unique().tolist()) if 'Persona asignada' in df.columns else [],
-        'Desarrollador': sorted(df['Desarrollador'].dropna().unique().tolist()) if 'Desarrollador' in df.columns else [],
-    }
-
-    def generate_options(options_list):
-        return ''.join([f'<option value="{html_escape(opt)}">{html_escape(opt)}</option>' for opt in options_list])
-
-    # Get min and max dates for date filter defaults
-    min_release_date = df['Fecha Real de Liberación'].min().strftime('%Y-%m-%d') if not df['Fecha Real de Liberación'].isnull().all() else ''
-    max_release_date = df['Fecha Real de Liberación'].max().strftime('%Y-%m-%d') if not df['Fecha Real de Liberación'].isnull().all() else ''
-
-    filters_html = f"""
-    <div class="section filters-section">
-        <h2>Filter Data</h2>
-        <div class="filters-grid">
-            <div class="filter-group">
-                <label for="filterEstado">Estado:</label>
-                <select id="filterEstado" onchange="filterData()">
-                    <option value="">All</option>
-                    {generate_options(filter_options['Estado'])}
-                </select>
-            </div>
-            <div class="filter-group">
-                <label for="filterPr">Prioridad:</label>
-                <select id="filterPr" onchange="filterData()">
-                    <option value="">All</option>
-                    {generate_options(filter_options['Pr'])}
-                </select>
-            </div>
-            <div class="filter-group">
-                <label for="filterTipo">Tipo:</label>
-                <select id="filterTipo" onchange="filterData()">
-                    <option value="">All</option>
-                    {generate_options(filter_options['T'])}
-                </select>
-            </div>
-            <div class="filter-group">
-                <label for="filterPersona">Persona Asignada:</label>
-                <select id="filterPersona" onchange="filterData()">
-                    <option value="">All</option>
-                    {generate_options(filter_options['Persona asignada'])}
-                </select>
-            </div>
-            <div class="filter-group">
-                <label for="filterDesarrollador">Desarrollador:</label>
-                <select id="filterDesarrollador" onchange="filterData()">
-                    <option value="">All</option>
-                    {generate_options(filter_options['Desarrollador'])}
-                </select>
-            </div>
-            <div class="filter-group">
-                <label for="startDate">Fecha Liberación (Start):</label>
-                <input type="date" id="startDate" value="{min_release_date}" onchange="filterData()">
-            </div>
-            <div class="filter-group">
-                <label for="endDate">Fecha Liberación (End):</label>
-                <input type="date" id="endDate" value="{max_release_date}" onchange="filterData()">
-            </div>
-            <button onclick="resetFilters()">Reset Filters</button>
-        </div>
-    </div>
-    """
-
-    # Cards section
-    cards_html = f"""
-    <div class="cards-row">
-      <div class="card"><div class="card-label">Total CSRs</div><div class="card-value" id="kpiTotalCSRs">{metrics['total_csrs']}</div></div>
-      <div class="card"><div class="card-label">Avg Delay (Days)</div><div class="card-value" id="kpiAvgDelay">{metrics['avg_delay']:.1f}</div></div>
-      <div class="card"><div class="card-label">% Released Late</div><div class="card-value" id="kpiPctLate">{metrics['pct_late']:.1f}%</div></div>
-      <div class="card"><div class="card-label">>30d in Dev</div><div class="card-value" id="kpiNumDevGT30">{metrics['num_dev_gt30']}</div></div>
-      <div class="card"><div class="card-label">>60d Dev→Release</div><div class="card-value" id="kpiNumDevLibGT60">{metrics['num_devlib_gt60']}</div></div>
-      <div class="card"><div class="card-label">Longest Delay (Days)</div><div class="card-value" id="kpiMaxDelay">{metrics['max_delay']:.1f}</div></div>
-      <div class="card"><div class="card-label">Shortest Delay (Days)</div><div class="card-value" id="kpiMinDelay">{metrics['min_delay']:.1f}</div></div>
-      <div class="card"><div class="card-label">Last updated</div><div class="card-value">{now}</div></div>
-    </div>
-    """
-
-    # Top delayed CSRs table
-    def make_table_html(data_rows, col_names):
-        """Generates HTML table rows from a list of dictionaries (from JS-filtered data)."""
-        rows_html = []
-        for r in data_rows:
-            # Safely get values, converting numbers to fixed-point strings where appropriate
-            summary = html_escape(r.get('Resumen', ''))
-            key = html_escape(r.get('Clave', ''))
-            # Get the value for the specific metric column (e.g., 'Liberación retrasada por')
-            metric_col_name = col_names[2] # Assumes the 3rd element in col_names is the metric key
-            col_value = r.get(metric_col_name, 0)
-            if isinstance(col_value, (int, float)):
-                col_value = f"{col_value:.1f}" if isinstance(col_value, float) else str(col_value)
-            else:
-                col_value = str(col_value)
-            assignee = html_escape(r.get('Persona asignada', ''))
-            developer = html_escape(r.get('Desarrollador', ''))
-
-            rows_html.append(
-                f"<tr><td>{summary}</td><td>{key}</td><td>{col_value}</td><td>{assignee}</td><td>{developer}</td></tr>"
-            )
-        return ''.join(rows_html)
-
-    # Initial table data (using Python-calculated top N)
-    table_late = make_table_html(metrics['top_late'].to_dict(orient='records'), ['Resumen', 'Clave', 'Liberación retrasada por', 'Persona asignada', 'Desarrollador'])
-    table_dev_gt30 = make_table_html(metrics['top_dev_gt30'].to_dict(orient='records'), ['Resumen', 'Clave', 'Estado Desarrollo > 30 días', 'Persona asignada', 'Desarrollador'])
-    table_devlib_gt60 = make_table_html(metrics['top_devlib_gt60'].to_dict(orient='records'), ['Resumen', 'Clave', 'Desarrollo y liberada > 60 Días', 'Persona asignada', 'Desarrollador'])
-
-
-    # HTML output template
-    html = f"""
+# Static fragments of the dashboard page. Keeping these as plain
+# module-level strings means render_dashboard only joins precomputed
+# pieces instead of re-parsing one huge brace-escaped f-string per call.
+_STATIC_HEAD = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -325,15 +328,15 @@ def render_dashboard(df, metrics):
     <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;700;900&display=swap" rel="stylesheet">
     <style>
-        body {{
+        body {
             font-family: 'Inter', sans-serif;
             background: #f5f6fa;
             color: #222;
             margin: 0;
             padding: 0;
             line-height: 1.6;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(90deg, #6a82fb 0%, #fc5c7d 100%);
             color: #fff;
             padding: 2rem 1rem;
@@ -341,17 +344,17 @@ def render_dashboard(df, metrics):
             border-bottom-left-radius: 1rem;
             border-bottom-right-radius: 1rem;
             box-shadow: 0 4px 10px rgba(0,0,0,0.1);
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             font-size: 2.8rem;
             margin-bottom: 0.5rem;
             font-weight: 900;
-        }}
-        .header p {{
+        }
+        .header p {
             font-size: 1.1rem;
             opacity: 0.9;
-        }}
-        .cards-row {{
+        }
+        .cards-row {
             display: flex;
             flex-wrap: wrap;
             gap: 1.5rem;
@@ -359,8 +362,8 @@ def render_dashboard(df, metrics):
             margin: -3rem auto 2rem auto; /* Overlap with header for visual effect */
             max-width: 1200px;
             padding: 0 1rem;
-        }}
-        .card {{
+        }
+        .card {
             background: #fff;
             border-radius: 1rem;
             box-shadow: 0 4px 12px rgba(0,0,0,0.08);
@@ -369,96 +372,96 @@ def render_dashboard(df, metrics):
             min-width: 160px;
             flex: 1 1 auto;
             transition: transform 0.2s ease-in-out;
-        }}
-        .card:hover {{
+        }
+        .card:hover {
             transform: translateY(-5px);
-        }}
-        .card-label {{
+        }
+        .card-label {
             font-size: 0.9rem;
             color: #888;
             margin-bottom: 0.3rem;
             font-weight: 700;
             text-transform: uppercase;
-        }}
-        .card-value {{
+        }
+        .card-value {
             font-size: 2.5rem;
             font-weight: 900;
             color: #6a82fb;
-        }}
-        .section {{
+        }
+        .section {
             margin: 2rem auto;
             max-width: 1200px;
             background: #fff;
             border-radius: 1rem;
             box-shadow: 0 4px 12px rgba(0,0,0,0.08);
             padding: 2rem;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #333;
             margin-bottom: 1.5rem;
             font-size: 1.8rem;
             border-bottom: 2px solid #eee;
             padding-bottom: 0.5rem;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 1rem;
             border-radius: 0.5rem;
             overflow: hidden; /* Ensures rounded corners on table */
-        }}
-        th, td {{
+        }
+        th, td {
             border-bottom: 1px solid #eee;
             padding: 0.8rem 1rem;
             font-size: 0.95rem;
             text-align: left;
-        }}
-        th {{
+        }
+        th {
             color: #fff;
             background: #6a82fb; /* Use a primary color for headers */
             font-weight: 700;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
-        tr:nth-child(even) {{
+        }
+        tr:nth-child(even) {
             background: #f9f9fc;
-        }}
-        tr:hover td {{
+        }
+        tr:hover td {
             background: #eef1f9;
-        }}
-        .charts-row {{
+        }
+        .charts-row {
             display: flex;
             flex-wrap: wrap;
             gap: 2rem;
             justify-content: center;
-        }}
-        .chart-block {{
+        }
+        .chart-block {
             flex: 1 1 45%; /* Adjust for 2 columns on larger screens */
             min-width: 300px; /* Minimum width for charts */
             padding: 1rem;
             box-sizing: border-box; /* Include padding in element's total width */
-        }}
-        #trendChart {{
+        }
+        #trendChart {
             width: 100%; /* Make trend chart span full width */
             min-height: 400px;
-        }}
-        .filters-section {{
+        }
+        .filters-section {
             padding-top: 0;
             margin-top: 1rem;
-        }}
-        .filters-grid {{
+        }
+        .filters-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 1rem;
             align-items: end;
-        }}
-        .filter-group label {{
+        }
+        .filter-group label {
             display: block;
             margin-bottom: 0.5rem;
             font-weight: 700;
             color: #555;
-        }}
-        .filter-group select, .filter-group input[type="date"] {{
+        }
+        .filter-group select, .filter-group input[type="date"] {
             width: 100%;
             padding: 0.6rem;
             border: 1px solid #ddd;
@@ -466,8 +469,8 @@ def render_dashboard(df, metrics):
             background-color: #fff;
             font-size: 1rem;
             box-shadow: inset 0 1px 3px rgba(0,0,0,0.05);
-        }}
-        .filters-grid button {{
+        }
+        .filters-grid button {
             background: #4CAF50;
             color: white;
             padding: 0.8rem 1.5rem;
@@ -477,36 +480,36 @@ def render_dashboard(df, metrics):
             font-size: 1rem;
             font-weight: 700;
             transition: background-color 0.3s ease;
-        }}
-        .filters-grid button:hover {{
+        }
+        .filters-grid button:hover {
             background-color: #45a049;
-        }}
-        @media (max-width: 900px) {{
-            .cards-row {{
+        }
+        @media (max-width: 900px) {
+            .cards-row {
                 margin-top: 1rem;
                 flex-direction: column;
                 align-items: center;
-            }}
-            .card {{
+            }
+            .card {
                 min-width: 80%; /* Cards take more width on small screens */
-            }}
-            .charts-row {{
+            }
+            .charts-row {
                 flex-direction: column;
                 align-items: center;
-            }}
-            .chart-block {{
+            }
+            .chart-block {
                 min-width: 95%; /* Charts take full width on small screens */
-            }}
-            .header h1 {{
+            }
+            .header h1 {
                 font-size: 2rem;
-            }}
-            .header p {{
+            }
+            .header p {
                 font-size: 0.9rem;
-            }}
-            .filters-grid {{
+            }
+            .filters-grid {
                 grid-template-columns: 1fr; /* Stack filters on small screens */
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
@@ -514,8 +517,12 @@ def render_dashboard(df, metrics):
         <h1>CSR Analytics Dashboard</h1>
         <p>Automated metrics & analysis from Jira export</p>
     </div>
-    {cards_html}
-    {filters_html}
+    """
+
+_BETWEEN_CARDS_FILTERS = """
+    """
+
+_STATIC_CHARTS = """
     <div class="section">
         <h2>Status, Priority & Type Distribution</h2>
         <div class="charts-row">
@@ -532,21 +539,27 @@ def render_dashboard(df, metrics):
         <h2>Top 10 Most Delayed Releases</h2>
         <table id="tableLate">
             <thead><tr><th>Resumen</th><th>Clave</th><th>Días retraso</th><th>Persona asignada</th><th>Desarrollador</th></tr></thead>
-            <tbody>{table_late}</tbody>
+            <tbody>"""
+
+_STATIC_TABLES_MID1 = """</tbody>
         </table>
     </div>
     <div class="section">
         <h2>Top 10 Longest Development (>30d)</h2>
         <table id="tableDevGT30">
             <thead><tr><th>Resumen</th><th>Clave</th><th>Días en dev</th><th>Persona asignada</th><th>Desarrollador</th></tr></thead>
-            <tbody>{table_dev_gt30}</tbody>
+            <tbody>"""
+
+_STATIC_TABLES_MID2 = """</tbody>
         </table>
     </div>
     <div class="section">
         <h2>Top 10 Longest Dev to Release (>60d)</h2>
         <table id="tableDevLibGT60">
             <thead><tr><th>Resumen</th><th>Clave</th><th>Días dev→liberada</th><th>Persona asignada</th><th>Desarrollador</th></tr></thead>
-            <tbody>{table_devlib_gt60}</tbody>
+            <tbody>"""
+
+_STATIC_BARS = """</tbody>
         </table>
     </div>
     <div class="section">
@@ -563,310 +576,1185 @@ def render_dashboard(df, metrics):
             <div class="chart-block"><div id="devDelay"></div></div>
         </div>
     </div>
-    <script>
-        // Store original data
-        // Use JSON.parse to safely parse the JSON string embedded by Python
-        const originalData = JSON.parse(`{full_data_json_str}`);
-        let currentData = originalData;
-
-        // Function to calculate metrics from a given dataset
-        function calculateMetrics(data) {{
-            const total_csrs = data.length;
-
-            // Handle potential non-numeric values in 'Liberación retrasada por'
-            const delayValues = data.map(d => parseFloat(d['Liberación retrasada por']) || 0);
-            const validDelays = delayValues.filter(d => !isNaN(d) && isFinite(d));
-            const avg_delay = validDelays.length > 0 ? validDelays.reduce((a, b) => a + b, 0) / validDelays.length : 0;
-            const pct_late = total_csrs > 0 ? (delayValues.filter(d => d > 0).length / total_csrs) * 100 : 0;
-            const max_delay = validDelays.length > 0 ? Math.max(...validDelays) : 0;
-            const min_delay = validDelays.length > 0 ? Math.min(...validDelays) : 0;
-
-            const dev30Values = data.map(d => parseFloat(d['Estado Desarrollo > 30 días']) || 0);
-            const validDev30 = dev30Values.filter(d => !isNaN(d) && isFinite(d));
-            const avg_dev_gt30 = validDev30.length > 0 ? validDev30.reduce((a, b) => a + b, 0) / validDev30.length : 0;
-            const num_dev_gt30 = dev30Values.filter(d => d > 0).length;
-
-            const dev60Values = data.map(d => parseFloat(d['Desarrollo y liberada > 60 Días']) || 0);
-            const validDev60 = dev60Values.filter(d => !isNaN(d) && isFinite(d));
-            const avg_devlib_gt60 = validDev60.length > 0 ? validDev60.reduce((a, b) => a + b, 0) / validDev60.length : 0;
-            const num_devlib_gt60 = dev60Values.filter(d => d > 0).length;
-
-            // Grouped data
-            function getCounts(arr, key) {{
-                return arr.reduce((acc, obj) => {{
-                    const val = obj[key];
-                    if (val) acc[val] = (acc[val] || 0) + 1;
-                    return acc;
-                }}, {{}});
-            }}
-
-            function getAvgDelay(arr, key) {{
-                const groups = arr.reduce((acc, obj) => {{
-                    const val = obj[key];
-                    // Ensure 'Liberación retrasada por' is treated as a number
-                    const delay = parseFloat(obj['Liberación retrasada por']) || 0;
-                    if (val) {{
-                        if (!acc[val]) acc[val] = {{ sum: 0, count: 0 }};
-                        acc[val].sum += delay;
-                        acc[val].count += 1;
-                    }}
-                    return acc;
-                }}, {{}});
-                const result = {{}};
-                for (const k in groups) {{
-                    result[k] = groups[k].sum / groups[k].count;
-                }}
-                return Object.fromEntries(Object.entries(result).sort(([, a], [, b]) => b - a)); // Sort descending
-            }}
-
-            const by_estado = getCounts(data, 'Estado');
-            const by_pr = getCounts(data, 'Pr');
-            const by_tipo = getCounts(data, 'T');
-            const by_persona = getCounts(data, 'Persona asignada');
-            const by_dev = getCounts(data, 'Desarrollador');
-
-            const delay_by_persona = getAvgDelay(data, 'Persona asignada');
-            const delay_by_dev = getAvgDelay(data, 'Desarrollador');
-
-            // Time series
-            function getTrend(arr, dateKey) {{
-                const trend = arr.reduce((acc, obj) => {{
-                    const dateStr = obj[dateKey];
-                    if (dateStr) {{
-                        const date = new Date(dateStr);
-                        // Get week string (YYYY-WW)
-                        const year = date.getFullYear();
-                        const firstDayOfYear = new Date(year, 0, 1);
-                        // Calculate day of the year (0-indexed)
-                        const dayOfYear = (date - firstDayOfYear) / (24 * 60 * 60 * 1000);
-                        // Week number (1-indexed, starting from Monday as first day of week)
-                        const week = Math.ceil((dayOfYear + firstDayOfYear.getDay() + 1) / 7);
-                        const weekStr = `${{year}}-W${{String(week).padStart(2, '0')}}`;
-                        acc[weekStr] = (acc[weekStr] || 0) + 1;
-                    }}
-                    return acc;
-                }}, {{}});
-                return Object.fromEntries(Object.entries(trend).sort()); // Sort by week string
-            }}
-
-            const created_trend = getTrend(data, 'Creada');
-            const resolved_trend = getTrend(data, 'Fecha Real de Liberación');
-
-            // Top 10 tables
-            function getTop10(arr, sortKey) {{
-                if (!sortKey || !arr || arr.length === 0) return [];
-                const sorted = [...arr].sort((a, b) => (parseFloat(b[sortKey]) || 0) - (parseFloat(a[sortKey]) || 0));
-                return sorted.slice(0, 10).map(d => ({{
-                    Resumen: d.Resumen,
-                    Clave: d.Clave,
-                    [sortKey]: d[sortKey],
-                    'Persona asignada': d['Persona asignada'],
-                    'Desarrollador': d['Desarrollador']
-                }}));
-            }}
-
-            const top_late = getTop10(data, 'Liberación retrasada por');
-            const top_dev_gt30 = getTop10(data, 'Estado Desarrollo > 30 días');
-            const top_devlib_gt60 = getTop10(data, 'Desarrollo y liberada > 60 Días');
-
-            return {{
+"""
+
+# Data plane of the dashboard. The browser never executes this block in
+# place (type="javascript/worker" is inert); the main script below spawns
+# a Worker from its text, so the payload decode, index building and
+# metric aggregation all run off the UI thread.
+_WORKER_SCRIPT = """
+    <script id="workerScript" type="javascript/worker">
+        // The columnar payload (one typed buffer per column, shared row
+        // index) lives in a gzip sidecar fetched on {type:'init'}: the
+        // typed arrays are built as zero-copy views on the decompressed
+        // buffer — no JSON tokenizer walk over the row data
+        const COLUMNS = {};
+        const CAT_DICTS = {};
+        const WEEK_BUCKETS = {};
+        // Build-time %G-W%V labels, one per week bin of each date column
+        const WEEK_LABELS = {};
+        // Packed threshold bitmaps (late / >30 / >60), one bit per row
+        const BITMAPS = {};
+        let NROWS = 0;
+        let ALL_INDICES = new Int32Array(0);
+        // Reused scratch buffer for filter results (no per-filter allocation)
+        let INDEX_BUFFER = new Int32Array(0);
+        // Filter result as a bitmap too, for the popcount KPI counts
+        let FILTER_BITS = new Uint32Array(0);
+        let ALL_BITS = new Uint32Array(0);
+        // Rows in release-date order (undated tail last) and the sorted
+        // dates themselves, for binary-searched date-range filtering
+        let RELEASE_ORDER = new Int32Array(0);
+        let RELEASE_MS_SORTED = new Float64Array(0);
+        let N_DATED = 0;
+
+        async function loadColumns(url) {
+            const resp = await fetch(url);
+            if (!resp.ok) throw new Error(`HTTP ${resp.status} for ${url}`);
+            const stream = resp.body.pipeThrough(new DecompressionStream('gzip'));
+            const buf = await new Response(stream).arrayBuffer();
+            // Layout: uint32 header length, JSON header (padded so the
+            // payload is 8-byte aligned), then the raw column buffers
+            const headerLen = new DataView(buf).getUint32(0, true);
+            const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buf, 4, headerLen)));
+            const base = 4 + headerLen;
+            NROWS = header.rows;
+            const words = Math.ceil(NROWS / 32);
+            for (const c of header.columns) {
+                if (c.kind === 'cat') {
+                    CAT_DICTS[c.name] = c.dict;
+                    COLUMNS[c.name] = new Int16Array(buf, base + c.offset, NROWS);
+                } else if (c.kind === 'bits') {
+                    BITMAPS[c.name] = new Uint32Array(buf, base + c.offset, words);
+                } else if (c.kind === 'perm') {
+                    RELEASE_ORDER = new Int32Array(buf, base + c.offset, NROWS);
+                    N_DATED = c.n_dated;
+                } else {
+                    COLUMNS[c.name] = new Float64Array(buf, base + c.offset, NROWS);
+                    if (c.kind === 'ms') {
+                        WEEK_BUCKETS[c.name] = new Int16Array(buf, base + c.week_offset, NROWS);
+                        WEEK_LABELS[c.name] = c.weeks;
+                    }
+                }
+            }
+            for (const name in header.strings) {
+                COLUMNS[name] = header.strings[name];
+            }
+            ALL_INDICES = Int32Array.from({length: NROWS}, (_, i) => i);
+            INDEX_BUFFER = new Int32Array(NROWS);
+            FILTER_BITS = new Uint32Array(words);
+            ALL_BITS = new Uint32Array(words).fill(0xffffffff);
+            if (NROWS % 32) {
+                ALL_BITS[words - 1] = ((1 << (NROWS % 32)) >>> 0) - 1;
+            }
+            // Gather the sorted dates once so the binary searches touch a
+            // dense array instead of hopping through the permutation
+            const releaseMs = COLUMNS['Fecha Real de Liberación'];
+            if (releaseMs && RELEASE_ORDER.length) {
+                RELEASE_MS_SORTED = new Float64Array(N_DATED);
+                for (let j = 0; j < N_DATED; j++) {
+                    RELEASE_MS_SORTED[j] = releaseMs[RELEASE_ORDER[j]];
+                }
+            }
+            buildIndexes();
+        }
+
+        // First index in [lo, hi) whose value is >= x (lowerBound) or
+        // > x (upperBound), on a sorted array
+        function lowerBound(a, x, lo, hi) {
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (a[mid] < x) lo = mid + 1; else hi = mid;
+            }
+            return lo;
+        }
+
+        function upperBound(a, x, lo, hi) {
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (a[mid] <= x) lo = mid + 1; else hi = mid;
+            }
+            return lo;
+        }
+
+        // Memoized {indices, metrics} per filter signature, evicting the
+        // oldest entry past the cap (Map preserves insertion order)
+        const METRICS_CACHE = new Map();
+        const METRICS_CACHE_MAX = 32;
+
+        // The previous filter state: when the user adds a constraint, the
+        // old result set is a superset of the new one and becomes the scan
+        // candidate list, so the work scales with the delta, not with N
+        let lastFilterState = null;
+
+        function col(name) {
+            return COLUMNS[name] || [];
+        }
+
+        function catLabel(name, code) {
+            return code >= 0 ? CAT_DICTS[name][code] : '';
+        }
+
+        const POSTINGS = {};
+        const EMPTY_POSTING = new Uint32Array(0);
+
+        // Derived lookup structures, built once after the payload arrives
+        function buildIndexes() {
+            // Inverted indices: POSTINGS[name][code] = Uint32Array of the
+            // rows holding that code, built in one counting pass per
+            // categorical column. Filtering seeds from the smallest
+            // selected posting list instead of scanning all rows.
+            for (const name in CAT_DICTS) {
+                const codes = COLUMNS[name];
+                const nvals = CAT_DICTS[name].length;
+                const counts = new Uint32Array(nvals);
+                for (let i = 0; i < NROWS; i++) {
+                    if (codes[i] >= 0) counts[codes[i]]++;
+                }
+                const lists = [];
+                for (let v = 0; v < nvals; v++) lists.push(new Uint32Array(counts[v]));
+                counts.fill(0);
+                for (let i = 0; i < NROWS; i++) {
+                    const v = codes[i];
+                    if (v >= 0) lists[v][counts[v]++] = i;
+                }
+                POSTINGS[name] = lists;
+            }
+        }
+
+        // Bounded min-heap keeping the k largest values seen: the root is
+        // the current cutoff, so each row costs one comparison and only the
+        // k survivors are ever reordered — no full sort of the index set
+        function makeTopK(k) {
+            const vals = new Float64Array(k);
+            const rows = new Int32Array(k);
+            let size = 0;
+            function siftDown() {
+                let p = 0;
+                for (;;) {
+                    let c = 2 * p + 1;
+                    if (c >= size) break;
+                    if (c + 1 < size && vals[c + 1] < vals[c]) c++;
+                    if (vals[p] <= vals[c]) break;
+                    const v = vals[p]; vals[p] = vals[c]; vals[c] = v;
+                    const r = rows[p]; rows[p] = rows[c]; rows[c] = r;
+                    p = c;
+                }
+            }
+            return {
+                push(row, val) {
+                    if (size < k) {
+                        let c = size++;
+                        vals[c] = val; rows[c] = row;
+                        while (c > 0) {
+                            const p = (c - 1) >> 1;
+                            if (vals[p] <= vals[c]) break;
+                            const v = vals[p]; vals[p] = vals[c]; vals[c] = v;
+                            const r = rows[p]; rows[p] = rows[c]; rows[c] = r;
+                            c = p;
+                        }
+                    } else if (val > vals[0]) {
+                        vals[0] = val; rows[0] = row;
+                        siftDown();
+                    }
+                },
+                // Selected row indices, largest value first (earlier rows
+                // win ties, like nlargest on the Python side)
+                result() {
+                    const order = [];
+                    for (let j = 0; j < size; j++) order.push(j);
+                    order.sort((a, b) => (vals[b] - vals[a]) || (rows[a] - rows[b]));
+                    return order.map(j => rows[j]);
+                },
+            };
+        }
+
+        // Branch-free 32-bit population count (SWAR)
+        function popcount32(v) {
+            v = v - ((v >>> 1) & 0x55555555);
+            v = (v & 0x33333333) + ((v >>> 2) & 0x33333333);
+            return (((v + (v >>> 4)) & 0x0f0f0f0f) * 0x01010101) >>> 24;
+        }
+
+        // Function to calculate metrics for a set of row indices; bits is
+        // the same selection as a bitmap, for the popcount KPI counts
+        function calculateMetrics(indices, bits) {
+            const total_csrs = indices.length;
+
+            const delayCol = col('Liberación retrasada por');
+            const dev30Col = col('Estado Desarrollo > 30 días');
+            const dev60Col = col('Desarrollo y liberada > 60 Días');
+            const estadoCodes = col('Estado');
+            const prCodes = col('Pr');
+            const tipoCodes = col('T');
+            const personaCodes = col('Persona asignada');
+            const devCodes = col('Desarrollador');
+            const createdBuckets = WEEK_BUCKETS['Creada'];
+            const resolvedBuckets = WEEK_BUCKETS['Fecha Real de Liberación'];
+
+            // Code-indexed accumulators: group counts, per-group delay
+            // sums/counts, and trend bincounts all live in small flat typed
+            // arrays sized from the dictionaries and bucket ranges
+            const estadoCounts = new Int32Array((CAT_DICTS['Estado'] || []).length);
+            const prCounts = new Int32Array((CAT_DICTS['Pr'] || []).length);
+            const tipoCounts = new Int32Array((CAT_DICTS['T'] || []).length);
+            const personaCounts = new Int32Array((CAT_DICTS['Persona asignada'] || []).length);
+            const devCounts = new Int32Array((CAT_DICTS['Desarrollador'] || []).length);
+            const personaDelaySums = new Float64Array(personaCounts.length);
+            const personaDelayCounts = new Int32Array(personaCounts.length);
+            const devDelaySums = new Float64Array(devCounts.length);
+            const devDelayCounts = new Int32Array(devCounts.length);
+            const createdLabels = WEEK_LABELS['Creada'] || [];
+            const resolvedLabels = WEEK_LABELS['Fecha Real de Liberación'] || [];
+            const createdCounts = new Int32Array(createdLabels.length);
+            const resolvedCounts = new Int32Array(resolvedLabels.length);
+
+            // One fused pass updates every accumulator per row: the index
+            // set and all columns are walked once instead of once per
+            // metric, so the hot data stays in cache. Missing values stay
+            // NaN (numerics) or -1 (codes/buckets), so averages only cover
+            // rows with data, matching the Python (INITIAL_METRICS)
+            // semantics.
+            let dSum = 0, dN = 0, dMax = -Infinity, dMinPos = Infinity;
+            let d30Sum = 0, d30N = 0;
+            let d60Sum = 0, d60N = 0;
+            const topLate = makeTopK(10);
+            const topDev30 = makeTopK(10);
+            const topDev60 = makeTopK(10);
+            for (let k = 0; k < indices.length; k++) {
+                const i = indices[k];
+                const d = delayCol[i];
+                const hasDelay = isFinite(d);
+                if (hasDelay) {
+                    dSum += d; dN++;
+                    if (d > dMax) dMax = d;
+                    if (d > 0 && d < dMinPos) dMinPos = d;
+                }
+                // Like nlargest on the Python side, rows without data are
+                // not candidates for the top-10 tables
+                if (hasDelay) topLate.push(i, d);
+                const d30 = dev30Col[i];
+                if (isFinite(d30)) {
+                    d30Sum += d30; d30N++;
+                    topDev30.push(i, d30);
+                }
+                const d60 = dev60Col[i];
+                if (isFinite(d60)) {
+                    d60Sum += d60; d60N++;
+                    topDev60.push(i, d60);
+                }
+                const eC = estadoCodes[i];
+                if (eC >= 0) estadoCounts[eC]++;
+                const prC = prCodes[i];
+                if (prC >= 0) prCounts[prC]++;
+                const tC = tipoCodes[i];
+                if (tC >= 0) tipoCounts[tC]++;
+                const pC = personaCodes[i];
+                if (pC >= 0) {
+                    personaCounts[pC]++;
+                    if (hasDelay) {
+                        personaDelaySums[pC] += d;
+                        personaDelayCounts[pC]++;
+                    }
+                }
+                const vC = devCodes[i];
+                if (vC >= 0) {
+                    devCounts[vC]++;
+                    if (hasDelay) {
+                        devDelaySums[vC] += d;
+                        devDelayCounts[vC]++;
+                    }
+                }
+                const cB = createdBuckets ? createdBuckets[i] : -1;
+                if (cB >= 0) createdCounts[cB]++;
+                const rB = resolvedBuckets ? resolvedBuckets[i] : -1;
+                if (rB >= 0) resolvedCounts[rB]++;
+            }
+            // The "value > 0" counts come from the precomputed bitmaps: a
+            // word-wide AND with the selection bitmap plus a popcount per
+            // 32-bit word replaces three per-row comparisons in the loop
+            let dLate = 0, d30Gt = 0, d60Gt = 0;
+            const lateBits = BITMAPS['late_bits'];
+            const dev30Bits = BITMAPS['dev_gt30_bits'];
+            const dev60Bits = BITMAPS['devlib_gt60_bits'];
+            for (let w = 0; w < bits.length; w++) {
+                const fw = bits[w];
+                if (fw === 0) continue;
+                if (lateBits) dLate += popcount32(fw & lateBits[w]);
+                if (dev30Bits) d30Gt += popcount32(fw & dev30Bits[w]);
+                if (dev60Bits) d60Gt += popcount32(fw & dev60Bits[w]);
+            }
+
+            const avg_delay = dN > 0 ? dSum / dN : 0;
+            const pct_late = total_csrs > 0 ? (dLate / total_csrs) * 100 : 0;
+            const max_delay = dN > 0 ? dMax : 0;
+            const min_delay = dLate > 0 ? dMinPos : 0;
+            const avg_dev_gt30 = d30N > 0 ? d30Sum / d30N : 0;
+            const num_dev_gt30 = d30Gt;
+            const avg_devlib_gt60 = d60N > 0 ? d60Sum / d60N : 0;
+            const num_devlib_gt60 = d60Gt;
+
+            // Materialize labelled objects from the code-indexed arrays,
+            // largest first like the Python value_counts/sort_values output
+            function countsToObject(key, counts) {
+                const dict = CAT_DICTS[key] || [];
+                const result = {};
+                for (let c = 0; c < dict.length; c++) {
+                    if (counts[c] > 0) result[dict[c]] = counts[c];
+                }
+                return Object.fromEntries(Object.entries(result).sort(([, a], [, b]) => b - a));
+            }
+
+            function avgsToObject(key, groupCounts, sums, counts) {
+                const dict = CAT_DICTS[key] || [];
+                const result = {};
+                for (let c = 0; c < dict.length; c++) {
+                    // Groups present in the subset but without delay data
+                    // average to 0, as in INITIAL_METRICS
+                    if (groupCounts[c] > 0) {
+                        result[dict[c]] = counts[c] > 0 ? sums[c] / counts[c] : 0;
+                    }
+                }
+                return Object.fromEntries(Object.entries(result).sort(([, a], [, b]) => b - a));
+            }
+
+            // Trim the bincount to the filtered subset's first/last occupied
+            // bin, then emit every bin in that range, zeros included,
+            // matching the weekly Grouper bins of INITIAL_METRICS. Labels
+            // come straight from the build-time arrays.
+            function trendToObject(labels, counts) {
+                let lo = 0, hi = counts.length - 1;
+                while (lo <= hi && counts[lo] === 0) lo++;
+                while (hi >= lo && counts[hi] === 0) hi--;
+                const trend = {};
+                for (let b = lo; b <= hi; b++) {
+                    trend[labels[b]] = counts[b];
+                }
+                return trend;
+            }
+
+            const by_estado = countsToObject('Estado', estadoCounts);
+            const by_pr = countsToObject('Pr', prCounts);
+            const by_tipo = countsToObject('T', tipoCounts);
+            const by_persona = countsToObject('Persona asignada', personaCounts);
+            const by_dev = countsToObject('Desarrollador', devCounts);
+
+            const delay_by_persona = avgsToObject('Persona asignada', personaCounts, personaDelaySums, personaDelayCounts);
+            const delay_by_dev = avgsToObject('Desarrollador', devCounts, devDelaySums, devDelayCounts);
+
+            const created_trend = trendToObject(createdLabels, createdCounts);
+            const resolved_trend = trendToObject(resolvedLabels, resolvedCounts);
+
+            // Top 10 tables: only the heap survivors get materialized
+            function topToRows(heap, sortKey) {
+                const column = col(sortKey);
+                return heap.result().map(i => ({
+                    Resumen: col('Resumen')[i],
+                    Clave: col('Clave')[i],
+                    [sortKey]: column[i] || 0,
+                    'Persona asignada': catLabel('Persona asignada', personaCodes[i]),
+                    'Desarrollador': catLabel('Desarrollador', devCodes[i])
+                }));
+            }
+
+            const top_late = topToRows(topLate, 'Liberación retrasada por');
+            const top_dev_gt30 = topToRows(topDev30, 'Estado Desarrollo > 30 días');
+            const top_devlib_gt60 = topToRows(topDev60, 'Desarrollo y liberada > 60 Días');
+
+            // Display strings are formatted here, once per aggregation,
+            // so the render path passes them through untouched
+            const delay_by_persona_text = Object.values(delay_by_persona).map(v => v.toFixed(1));
+            const delay_by_dev_text = Object.values(delay_by_dev).map(v => v.toFixed(1));
+
+            return {
                 total_csrs,
                 avg_delay: avg_delay,
+                avg_delay_text: avg_delay.toFixed(1),
                 pct_late,
+                pct_late_text: pct_late.toFixed(1) + '%',
                 avg_dev_gt30,
                 num_dev_gt30,
                 avg_devlib_gt60,
                 num_devlib_gt60,
                 max_delay,
+                max_delay_text: max_delay.toFixed(1),
                 min_delay,
+                min_delay_text: min_delay.toFixed(1),
                 by_estado,
                 by_pr,
                 by_tipo,
                 by_persona,
                 by_dev,
                 delay_by_persona,
+                delay_by_persona_text,
                 delay_by_dev,
+                delay_by_dev_text,
                 created_trend,
                 resolved_trend,
                 top_late,
                 top_dev_gt30,
                 top_devlib_gt60,
-            }};
-        }}
+            };
+        }
+
+        // Column order of the code tuple posted by the page's filter UI
+        const FILTER_KEYS = ['Estado', 'Pr', 'T', 'Persona asignada', 'Desarrollador'];
+
+        function computeFilter(query) {
+            const sigParts = query.codes;
+            const startMs = query.startMs;
+            const endMs = query.endMs;
+            const dateFiltered = query.dateFiltered;
+
+            // The codes are dictionary positions, so the row loop is pure
+            // integer comparisons with no label resolution (-2 = inactive)
+            const catFilters = [];
+            for (let f = 0; f < FILTER_KEYS.length; f++) {
+                if (sigParts[f] !== -2) {
+                    catFilters.push([FILTER_KEYS[f], sigParts[f], col(FILTER_KEYS[f])]);
+                }
+            }
+
+            // Toggling back to a previously seen combination replays the
+            // memoized result without rescanning or re-aggregating
+            const sig = sigParts.join('|') + '|' + startMs + '|' + endMs;
+            const cached = METRICS_CACHE.get(sig);
+            if (cached) {
+                lastFilterState = {sigParts, startMs, endMs, indices: cached.indices};
+                return cached.metrics;
+            }
+
+            // A query with no constraints selects every row: aggregate
+            // straight over the precomputed full index range and all-ones
+            // bitmap, no scan and no bitmap rebuild
+            if (catFilters.length === 0 && !dateFiltered) {
+                const entry = {
+                    indices: ALL_INDICES,
+                    metrics: calculateMetrics(ALL_INDICES, ALL_BITS),
+                };
+                METRICS_CACHE.set(sig, entry);
+                if (METRICS_CACHE.size > METRICS_CACHE_MAX) {
+                    METRICS_CACHE.delete(METRICS_CACHE.keys().next().value);
+                }
+                lastFilterState = {sigParts, startMs, endMs, indices: ALL_INDICES};
+                return entry.metrics;
+            }
+
+            // Seed from the smallest posting list among the selected values;
+            // with no categorical filter the seed is the full index range
+            let candidates = ALL_INDICES;
+            let seedKey = null;
+            for (const [key, code] of catFilters) {
+                const plist = code >= 0 ? POSTINGS[key][code] : EMPTY_POSTING;
+                if (plist.length < candidates.length) {
+                    candidates = plist;
+                    seedKey = key;
+                }
+            }
+
+            // If the new filters strictly narrow the previous state (every
+            // previously active constraint unchanged, date range contained),
+            // the previous result set is a valid candidate list — use it
+            // when it beats the best posting list
+            if (lastFilterState && lastFilterState.indices.length < candidates.length) {
+                const prev = lastFilterState;
+                let narrower = prev.startMs <= startMs && prev.endMs >= endMs;
+                for (let f = 0; narrower && f < sigParts.length; f++) {
+                    if (prev.sigParts[f] !== -2 && prev.sigParts[f] !== sigParts[f]) {
+                        narrower = false;
+                    }
+                }
+                if (narrower) {
+                    candidates = prev.indices;
+                    // Rows here are not pre-filtered on any single key, so
+                    // every categorical predicate must be re-checked
+                    seedKey = null;
+                }
+            }
+
+            // An active date range is a contiguous slice of the release-
+            // sorted permutation, found by two binary searches; the
+            // undated tail is excluded by construction. Use it when it
+            // beats the candidate list found above.
+            let dateOrdered = false;
+            if (dateFiltered && RELEASE_MS_SORTED.length) {
+                const lo = lowerBound(RELEASE_MS_SORTED, startMs, 0, N_DATED);
+                const hi = upperBound(RELEASE_MS_SORTED, endMs, lo, N_DATED);
+                if (hi - lo < candidates.length) {
+                    candidates = RELEASE_ORDER.subarray(lo, hi);
+                    seedKey = null;
+                    dateOrdered = true;
+                }
+            }
+
+            const releaseMs = col('Fecha Real de Liberación');
+            FILTER_BITS.fill(0);
+            let n = 0;
+            for (let k = 0; k < candidates.length; k++) {
+                const i = candidates[k];
+                let ok = true;
+                for (let f = 0; f < catFilters.length; f++) {
+                    const filt = catFilters[f];
+                    if (filt[0] === seedKey) continue;
+                    if (filt[2][i] !== filt[1]) { ok = false; break; }
+                }
+                if (!ok) continue;
+                const t = releaseMs[i];
+                if (isFinite(t)) {
+                    if (t < startMs || t > endMs) continue;
+                } else if (dateFiltered) {
+                    // A date filter excludes CSRs with no release date
+                    continue;
+                }
+                INDEX_BUFFER[n++] = i;
+                FILTER_BITS[i >> 5] |= 1 << (i & 31);
+            }
+            // The sorted scan visits rows in date order; recover ascending
+            // row order from the selection bitmap so the top-10 tie-breaks
+            // match the unsorted path (and Python's nlargest)
+            if (dateOrdered) {
+                n = 0;
+                for (let w = 0; w < FILTER_BITS.length; w++) {
+                    let word = FILTER_BITS[w];
+                    while (word) {
+                        const low = word & -word;
+                        INDEX_BUFFER[n++] = (w << 5) + (31 - Math.clz32(low));
+                        word ^= low;
+                    }
+                }
+            }
+            // Cached entries own a copy of the indices: INDEX_BUFFER is
+            // scratch and will be overwritten by the next filter change
+            const entry = {
+                indices: INDEX_BUFFER.slice(0, n),
+                metrics: null,
+            };
+            entry.metrics = calculateMetrics(entry.indices, FILTER_BITS);
+            METRICS_CACHE.set(sig, entry);
+            if (METRICS_CACHE.size > METRICS_CACHE_MAX) {
+                METRICS_CACHE.delete(METRICS_CACHE.keys().next().value);
+            }
+            lastFilterState = {sigParts, startMs, endMs, indices: entry.indices};
+            return entry.metrics;
+        }
+
+        onmessage = (e) => {
+            const msg = e.data;
+            if (msg.type === 'init') {
+                loadColumns(msg.url).then(
+                    () => postMessage({type: 'ready'}),
+                    (err) => postMessage({type: 'error', message: String(err)}),
+                );
+            } else if (msg.type === 'filter') {
+                postMessage({type: 'metrics', id: msg.id, metrics: computeFilter(msg)});
+            }
+        };
+    </script>"""
+
+_SCRIPT_PRE = """
+    <script>
+        // Metrics for the unfiltered dataset, precomputed at build time
+        const INITIAL_METRICS = """
+
+_SCRIPT_TAIL = """;
+        // The data plane (payload decode, indexes, aggregation) runs in a
+        // Worker built from the inline block above, so a filter change
+        // never blocks the UI thread: the page reads the inputs, posts the
+        // compact filter tuple and renders the small metrics object that
+        // comes back
+        // Filtering is inert until the worker reports the payload decoded;
+        // a filter change made while loading is replayed once it is ready
+        let dataReady = false;
+        let filterPending = false;
+        // At most one job in the worker and one waiting behind it: a burst
+        // of changes overwrites the waiting query instead of queueing, and
+        // a stale in-flight answer (superseded query or a reset) is
+        // dropped via the id check
+        let filterInFlight = false;
+        let pendingQuery = null;
+        let queryCounter = 0;
+        let lastQueryId = 0;
+
+        let worker = null;
+        try {
+            worker = new Worker(URL.createObjectURL(new Blob(
+                [document.getElementById('workerScript').textContent],
+                {type: 'text/javascript'})));
+            worker.onmessage = (e) => {
+                const msg = e.data;
+                if (msg.type === 'ready') {
+                    dataReady = true;
+                    if (filterPending) {
+                        filterPending = false;
+                        filterData();
+                    }
+                } else if (msg.type === 'metrics') {
+                    filterInFlight = false;
+                    if (msg.id === lastQueryId) updateDashboard(msg.metrics);
+                    if (pendingQuery) {
+                        const query = pendingQuery;
+                        pendingQuery = null;
+                        postQuery(query);
+                    }
+                } else if (msg.type === 'error') {
+                    // Without the sidecar (e.g. the HTML opened as a bare
+                    // file) the precomputed render still stands; only the
+                    // filters stay inert
+                    console.error('Could not load the data payload:', msg.message);
+                }
+            };
+            // Blob workers resolve relative URLs against the blob, so the
+            // sidecar URL is resolved against the page here
+            worker.postMessage({type: 'init', url: new URL('dashboard_data.bin.gz', location.href).href});
+        } catch (err) {
+            console.error('Could not start the data worker:', err);
+        }
+
+        function postQuery(query) {
+            filterInFlight = true;
+            lastQueryId = ++queryCounter;
+            worker.postMessage({type: 'filter', id: lastQueryId, ...query});
+        }
+
+        // Table bodies are static DOM, so resolve each once instead of
+        // re-querying the selector on every update
+        const tableBodies = {};
+        function tableBody(tableId) {
+            return tableBodies[tableId] ||
+                (tableBodies[tableId] = document.querySelector(`#${tableId} tbody`));
+        }
+
+        function updateTable(tableId, data, colNames) {
+            // Build the rows off-document and swap them in with a single
+            // replaceChildren call: one DOM mutation per table, no
+            // incremental reflows and no per-row HTML parsing
+            const frag = document.createDocumentFragment();
+            data.forEach(row => {
+                const tr = document.createElement('tr');
+                // Manually map to ensure correct order and format
+                const summary = row.Resumen || '';
+                const key = row.Clave || '';
+                const metricValue = typeof row[colNames[2]] === 'number' ? row[colNames[2]].toFixed(1) : (row[colNames[2]] || '0');
+                const assignee = row['Persona asignada'] || '';
+                const developer = row['Desarrollador'] || '';
+
+                // textContent keeps raw values XSS-safe without HTML escaping
+                for (const value of [summary, key, metricValue, assignee, developer]) {
+                    const td = document.createElement('td');
+                    td.textContent = value;
+                    tr.appendChild(td);
+                }
+                frag.appendChild(tr);
+            });
+            tableBody(tableId).replaceChildren(frag);
+        }
+
+        // Chart topology (trace types, layouts, colors) never changes, so
+        // each panel is created once with Plotly.newPlot and later updates
+        // go through Plotly.restyle with fresh data only — no layout
+        // re-diffing per filter change
+        const PIE_COLORS = ['#6a82fb', '#fc5c7d', '#4CAF50', '#FFC107', '#2196F3', '#FF5722'];
+        function initCharts() {
+            Plotly.newPlot('estadoPie', [{labels: [], values: [], type: 'pie', hole: .5, textinfo: 'label+percent', marker: {colors: PIE_COLORS}}], {title: 'Estado', height: 350});
+            Plotly.newPlot('prPie', [{labels: [], values: [], type: 'pie', hole: .5, textinfo: 'label+percent', marker: {colors: PIE_COLORS}}], {title: 'Prioridad', height: 350});
+            Plotly.newPlot('tipoPie', [{labels: [], values: [], type: 'pie', hole: .5, textinfo: 'label+percent', marker: {colors: PIE_COLORS}}], {title: 'Tipo', height: 350});
+            Plotly.newPlot('trendChart', [
+                {x: [], y: [], name: 'Created', type: 'scatter', mode: 'lines+markers', line: {color: '#6a82fb'}},
+                {x: [], y: [], name: 'Released', type: 'scatter', mode: 'lines+markers', line: {color: '#4CAF50'}}
+            ], {
+                title: 'CSRs Created & Released by Week',
+                xaxis: {title: 'Week'},
+                yaxis: {title: 'Number of CSRs'},
+                height: 400
+            });
+            Plotly.newPlot('personaBar', [{x: [], y: [], type: 'bar', marker: {color: '#6a82fb'}}], {title: 'CSRs by Persona Asignada', height: 350});
+            Plotly.newPlot('devBar', [{x: [], y: [], type: 'bar', marker: {color: '#fc5c7d'}}], {title: 'CSRs by Desarrollador', height: 350});
+            Plotly.newPlot('personaDelay', [{x: [], y: [], text: [], texttemplate: '%{text}', type: 'bar', marker: {color: '#6a82fb'}}], {title: 'Avg Delay by Persona Asignada (Days)', height: 350});
+            Plotly.newPlot('devDelay', [{x: [], y: [], text: [], texttemplate: '%{text}', type: 'bar', marker: {color: '#fc5c7d'}}], {title: 'Avg Delay by Desarrollador (Days)', height: 350});
+        }
 
         // Function to update the dashboard with new metrics
-        function updateDashboard(metrics) {{
-            // Update KPIs
-            document.getElementById('kpiTotalCSRs').innerText = metrics.total_csrs;
-            document.getElementById('kpiAvgDelay').innerText = metrics.avg_delay.toFixed(1);
-            document.getElementById('kpiPctLate').innerText = metrics.pct_late.toFixed(1) + '%';
-            document.getElementById('kpiNumDevGT30').innerText = metrics.num_dev_gt30;
-            document.getElementById('kpiNumDevLibGT60').innerText = metrics.num_devlib_gt60;
-            document.getElementById('kpiMaxDelay').innerText = metrics.max_delay.toFixed(1);
-            document.getElementById('kpiMinDelay').innerText = metrics.min_delay.toFixed(1);
+        let lastMetrics = null;
+        function updateDashboard(metrics) {
+            // Memoized metrics are shared objects, so reference equality is
+            // enough to skip panels whose data did not change (a cache
+            // replay short-circuits the whole update)
+            const prev = lastMetrics;
+            lastMetrics = metrics;
+            if (prev === metrics) return;
+            const changed = (key) => !prev || prev[key] !== metrics[key];
+
+            // Update KPIs: the display strings come pre-formatted with the
+            // metrics, and the per-key check skips untouched writes
+            if (changed('total_csrs')) document.getElementById('kpiTotalCSRs').innerText = metrics.total_csrs;
+            if (changed('avg_delay_text')) document.getElementById('kpiAvgDelay').innerText = metrics.avg_delay_text;
+            if (changed('pct_late_text')) document.getElementById('kpiPctLate').innerText = metrics.pct_late_text;
+            if (changed('num_dev_gt30')) document.getElementById('kpiNumDevGT30').innerText = metrics.num_dev_gt30;
+            if (changed('num_devlib_gt60')) document.getElementById('kpiNumDevLibGT60').innerText = metrics.num_devlib_gt60;
+            if (changed('max_delay_text')) document.getElementById('kpiMaxDelay').innerText = metrics.max_delay_text;
+            if (changed('min_delay_text')) document.getElementById('kpiMinDelay').innerText = metrics.min_delay_text;
 
             // Update Pie Charts
-            Plotly.react('estadoPie', [{{labels: Object.keys(metrics.by_estado), values: Object.values(metrics.by_estado), type: 'pie', hole: .5, textinfo: 'label+percent', marker: {{colors: ['#6a82fb', '#fc5c7d', '#4CAF50', '#FFC107', '#2196F3', '#FF5722']}}}}], {{title: 'Estado', height: 350}});
-            Plotly.react('prPie', [{{labels: Object.keys(metrics.by_pr), values: Object.values(metrics.by_pr), type: 'pie', hole: .5, textinfo: 'label+percent', marker: {{colors: ['#6a82fb', '#fc5c7d', '#4CAF50', '#FFC107', '#2196F3', '#FF5722']}}}}], {{title: 'Prioridad', height: 350}});
-            Plotly.react('tipoPie', [{{labels: Object.keys(metrics.by_tipo), values: Object.values(metrics.by_tipo), type: 'pie', hole: .5, textinfo: 'label+percent', marker: {{colors: ['#6a82fb', '#fc5c7d', '#4CAF50', '#FFC107', '#2196F3', '#FF5722']}}}}], {{title: 'Tipo', height: 350}});
-
-            // Update Trend Chart
-            Plotly.react('trendChart', [
-                {{x: Object.keys(metrics.created_trend), y: Object.values(metrics.created_trend), name:'Created', type:'scatter', mode:'lines+markers', line:{{color:'#6a82fb'}}}},
-                {{x: Object.keys(metrics.resolved_trend), y: Object.values(metrics.resolved_trend), name:'Released', type:'scatter', mode:'lines+markers', line:{{color:'#4CAF50'}}}}
-            ], {{
-                title: 'CSRs Created & Released by Week',
-                xaxis: {{title: 'Week'}},
-                yaxis: {{title: 'Number of CSRs'}},
-                height: 400
-            }});
+            if (changed('by_estado')) Plotly.restyle('estadoPie', {labels: [Object.keys(metrics.by_estado)], values: [Object.values(metrics.by_estado)]}, [0]);
+            if (changed('by_pr')) Plotly.restyle('prPie', {labels: [Object.keys(metrics.by_pr)], values: [Object.values(metrics.by_pr)]}, [0]);
+            if (changed('by_tipo')) Plotly.restyle('tipoPie', {labels: [Object.keys(metrics.by_tipo)], values: [Object.values(metrics.by_tipo)]}, [0]);
+
+            // Update Trend Chart (both traces in one restyle)
+            if (changed('created_trend') || changed('resolved_trend')) Plotly.restyle('trendChart', {
+                x: [Object.keys(metrics.created_trend), Object.keys(metrics.resolved_trend)],
+                y: [Object.values(metrics.created_trend), Object.values(metrics.resolved_trend)]
+            }, [0, 1]);
 
             // Update Bar Charts (Workload)
-            Plotly.react('personaBar', [{{x: Object.keys(metrics.by_persona), y: Object.values(metrics.by_persona), type:'bar', marker:{{color:'#6a82fb'}}}}], {{title: 'CSRs by Persona Asignada', height: 350}});
-            Plotly.react('devBar', [{{x: Object.keys(metrics.by_dev), y: Object.values(metrics.by_dev), type:'bar', marker:{{color:'#fc5c7d'}}}}], {{title: 'CSRs by Desarrollador', height: 350}});
-
-            // Update Bar Charts (Average Delay)
-            Plotly.react('personaDelay', [{{x: Object.keys(metrics.delay_by_persona), y: Object.values(metrics.delay_by_persona).map(v => v.toFixed(1)), type:'bar', marker:{{color:'#6a82fb'}} }}], {{title: 'Avg Delay by Persona Asignada (Days)', height: 350}});
-            Plotly.react('devDelay', [{{x: Object.keys(metrics.delay_by_dev), y: Object.values(metrics.delay_by_dev).map(v => v.toFixed(1)), type:'bar', marker:{{color:'#fc5c7d'}}}}], {{title: 'Avg Delay by Desarrollador (Days)', height: 350}});
-
-            // Update Tables
-            function updateTable(tableId, data, colNames) {{
-                const tableBody = document.querySelector(`#${{tableId}} tbody`);
-                tableBody.innerHTML = ''; // Clear existing rows
-                data.forEach(row => {{
-                    const tr = document.createElement('tr');
-                    // Manually map to ensure correct order and format
-                    const summary = row.Resumen || '';
-                    const key = row.Clave || '';
-                    const metricValue = typeof row[colNames[2]] === 'number' ? row[colNames[2]].toFixed(1) : (row[colNames[2]] || '0');
-                    const assignee = row['Persona asignada'] || '';
-                    const developer = row['Desarrollador'] || '';
-                    
-                    tr.innerHTML = `<td>${{summary}}</td><td>${{key}}</td><td>${{metricValue}}</td><td>${{assignee}}</td><td>${{developer}}</td>`;
-                    tableBody.appendChild(tr);
-                }});
-            }}
-
-            updateTable('tableLate', metrics.top_late, ['Resumen', 'Clave', 'Liberación retrasada por', 'Persona asignada', 'Desarrollador']);
-            updateTable('tableDevGT30', metrics.top_dev_gt30, ['Resumen', 'Clave', 'Estado Desarrollo > 30 días', 'Persona asignada', 'Desarrollador']);
-            updateTable('tableDevLibGT60', metrics.top_devlib_gt60, ['Resumen', 'Clave', 'Desarrollo y liberada > 60 Días', 'Persona asignada', 'Desarrollador']);
-        }}
-
-        function filterData() {{
-            const filterEstado = document.getElementById('filterEstado').value;
-            const filterPr = document.getElementById('filterPr').value;
-            const filterTipo = document.getElementById('filterTipo').value;
-            const filterPersona = document.getElementById('filterPersona').value;
-            const filterDesarrollador = document.getElementById('filterDesarrollador').value;
+            if (changed('by_persona')) Plotly.restyle('personaBar', {x: [Object.keys(metrics.by_persona)], y: [Object.values(metrics.by_persona)]}, [0]);
+            if (changed('by_dev')) Plotly.restyle('devBar', {x: [Object.keys(metrics.by_dev)], y: [Object.values(metrics.by_dev)]}, [0]);
+
+            // Update Bar Charts (Average Delay): numeric y plus the
+            // pre-formatted text, rendered via the texttemplate set at init
+            if (changed('delay_by_persona')) Plotly.restyle('personaDelay', {x: [Object.keys(metrics.delay_by_persona)], y: [Object.values(metrics.delay_by_persona)], text: [metrics.delay_by_persona_text]}, [0]);
+            if (changed('delay_by_dev')) Plotly.restyle('devDelay', {x: [Object.keys(metrics.delay_by_dev)], y: [Object.values(metrics.delay_by_dev)], text: [metrics.delay_by_dev_text]}, [0]);
+
+            if (changed('top_late')) updateTable('tableLate', metrics.top_late, ['Resumen', 'Clave', 'Liberación retrasada por', 'Persona asignada', 'Desarrollador']);
+            if (changed('top_dev_gt30')) updateTable('tableDevGT30', metrics.top_dev_gt30, ['Resumen', 'Clave', 'Estado Desarrollo > 30 días', 'Persona asignada', 'Desarrollador']);
+            if (changed('top_devlib_gt60')) updateTable('tableDevLibGT60', metrics.top_devlib_gt60, ['Resumen', 'Clave', 'Desarrollo y liberada > 60 Días', 'Persona asignada', 'Desarrollador']);
+        }
+
+        // Trailing debounce so a burst of input events (typed dates, quick
+        // dropdown changes) collapses into one recompute and render
+        let filterTimer = null;
+        function scheduleFilter() {
+            clearTimeout(filterTimer);
+            filterTimer = setTimeout(filterData, 80);
+        }
+
+        function filterData() {
+            if (!dataReady) {
+                filterPending = true;
+                return;
+            }
+            // Option values already carry the dictionary codes, so the
+            // whole selection travels as five small integers (-2 =
+            // inactive) plus the date bounds as epoch ms, end of day
+            // inclusive
+            const codes = [
+                'filterEstado', 'filterPr', 'filterTipo', 'filterPersona',
+                'filterDesarrollador',
+            ].map(id => {
+                const value = document.getElementById(id).value;
+                return value === '' ? -2 : parseInt(value, 10);
+            });
             const startDateStr = document.getElementById('startDate').value;
             const endDateStr = document.getElementById('endDate').value;
-
-            // Convert date strings to Date objects for comparison
-            const startDate = startDateStr ? new Date(startDateStr) : null;
-            // Set end date to end of the day for inclusive filtering
-            const endDate = endDateStr ? new Date(endDateStr) : null;
-            if (endDate) {{
-                endDate.setHours(23, 59, 59, 999);
-            }}
-
-            currentData = originalData.filter(d => {{
-                // Categorical filters
-                const matchEstado = filterEstado === '' || d['Estado'] === filterEstado;
-                const matchPr = filterPr === '' || d['Pr'] === filterPr;
-                const matchTipo = filterTipo === '' || d['T'] === filterTipo;
-                const matchPersona = filterPersona === '' || d['Persona asignada'] === filterPersona;
-                const matchDesarrollador = filterDesarrollador === '' || d['Desarrollador'] === filterDesarrollador;
-
-                // Date filter (Fecha Real de Liberación)
-                let matchDate = true;
-                if (d['Fecha Real de Liberación']) {{
-                    const releaseDate = new Date(d['Fecha Real de Liberación']);
-                    if (startDate && releaseDate < startDate) {{
-                        matchDate = false;
-                    }}
-                    if (endDate && releaseDate > endDate) {{
-                        matchDate = false;
-                    }}
-                }} else if (startDate || endDate) {{
-                    // If a date filter is applied but the CSR has no release date, it doesn't match
-                    matchDate = false;
-                }}
-                
-                return matchEstado && matchPr && matchTipo && matchPersona && matchDesarrollador && matchDate;
-            }});
-            updateDashboard(calculateMetrics(currentData));
-        }}
-
-        function resetFilters() {{
+            const query = {
+                codes,
+                startMs: startDateStr ? Date.parse(startDateStr) : -Infinity,
+                endMs: endDateStr ? Date.parse(endDateStr) + 86399999 : Infinity,
+                dateFiltered: startDateStr !== '' || endDateStr !== '',
+            };
+            if (filterInFlight) {
+                pendingQuery = query;
+            } else {
+                postQuery(query);
+            }
+        }
+
+        function resetFilters() {
             document.getElementById('filterEstado').value = '';
             document.getElementById('filterPr').value = '';
             document.getElementById('filterTipo').value = '';
             document.getElementById('filterPersona').value = '';
             document.getElementById('filterDesarrollador').value = '';
-            
-            // Reset date filters to min/max from original data
-            const minReleaseDate = originalData.reduce((min, d) => {{
-                if (d['Fecha Real de Liberación']) {{
-                    const current = new Date(d['Fecha Real de Liberación']);
-                    return min === null || current < min ? current : min;
-                }}
-                return min;
-            }}, null);
-
-            const maxReleaseDate = originalData.reduce((max, d) => {{
-                if (d['Fecha Real de Liberación']) {{
-                    const current = new Date(d['Fecha Real de Liberación']);
-                    return max === null || current > max ? current : max;
-                }}
-                return max;
-            }}, null);
-            
-            document.getElementById('startDate').value = minReleaseDate ? minReleaseDate.toISOString().split('T')[0] : '';
-            document.getElementById('endDate').value = maxReleaseDate ? maxReleaseDate.toISOString().split('T')[0] : '';
-
-            currentData = originalData;
-            updateDashboard(calculateMetrics(currentData));
-        }}
+
+            // Reset date filters to the build-time min/max release dates
+            document.getElementById('startDate').value = MIN_RELEASE_DATE;
+            document.getElementById('endDate').value = MAX_RELEASE_DATE;
+
+            // Drop any queued query and invalidate an in-flight answer so
+            // it cannot overwrite the reset render when it lands
+            pendingQuery = null;
+            lastQueryId = ++queryCounter;
+            updateDashboard(INITIAL_METRICS);
+        }
 
         // Initial dashboard render
-        document.addEventListener('DOMContentLoaded', () => {{
-            // Set initial date filter values based on data range
-            const initialMetrics = calculateMetrics(originalData);
-
-            // Dynamically set date inputs based on data
-            const releaseDates = originalData
-                                    .map(d => d['Fecha Real de Liberación'])
-                                    .filter(d => d); // Filter out empty/null dates
-            
-            let minDate = '';
-            let maxDate = '';
-
-            if (releaseDates.length > 0) {{
-                const dates = releaseDates.map(dateStr => new Date(dateStr));
-                const min = new Date(Math.min(...dates));
-                const max = new Date(Math.max(...dates));
-                minDate = min.toISOString().split('T')[0];
-                maxDate = max.toISOString().split('T')[0];
-            }}
-
-            document.getElementById('startDate').value = minDate;
-            document.getElementById('endDate').value = maxDate;
-
-            updateDashboard(initialMetrics);
-        }});
+        document.addEventListener('DOMContentLoaded', () => {
+            // The date inputs are pre-filled server-side; re-assert them so
+            // a back-navigation restore starts from the full range
+            document.getElementById('startDate').value = MIN_RELEASE_DATE;
+            document.getElementById('endDate').value = MAX_RELEASE_DATE;
+
+            // Metrics for the full dataset were computed at build time, so
+            // the charts paint immediately; the worker hydrates the row
+            // payload in the background and only gates interactivity
+            initCharts();
+            updateDashboard(INITIAL_METRICS);
+        });
 
     </script>
 </body>
 </html>
 """
+
+
+def render_dashboard(df, metrics):
+    """
+    Renders the HTML dashboard using the calculated metrics.
+    Includes sections for KPIs, charts (using Plotly.js), and tables for outliers.
+    Adds filter dropdowns and client-side JavaScript for interactivity.
+    """
+    now = datetime.now().strftime('%Y-%m-%d %H:%M')
+
+    # Serialize only the columns the client-side script actually uses, one
+    # buffer per column (SoA), into a gzip-compressed binary sidecar. The
+    # HTML itself then carries only the (small) precomputed metrics, so it
+    # parses instantly, and the client builds its typed arrays straight from
+    # the decompressed buffer instead of walking JSON text.
+    used_cols = [
+        'Resumen', 'Clave',
+        'Liberación retrasada por', 'Estado Desarrollo > 30 días',
+        'Desarrollo y liberada > 60 Días',
+        'Persona asignada', 'Desarrollador', 'Estado', 'Pr', 'T',
+        'Creada', 'Fecha Real de Liberación'
+    ]
+    # Bucket the columns by dtype family once instead of re-dispatching the
+    # three pd.api.types checks for every column
+    subset = df[[c for c in used_cols if c in df.columns]]
+    datetime_cols = set(subset.select_dtypes(include='datetime').columns)
+    numeric_cols = set(subset.select_dtypes(include='number').columns)
+
+    payload = bytearray()
+
+    def _append(raw):
+        # Every buffer starts 8-byte aligned so the client can construct
+        # Float64/Int32/Int16 views on the decompressed buffer zero-copy
+        offset = len(payload)
+        payload.extend(raw)
+        if len(payload) % 8:
+            payload.extend(b'\x00' * (8 - len(payload) % 8))
+        return offset
+
+    column_entries = []
+    string_columns = {}
+    for col in subset.columns:
+        s = subset[col]
+        if col in datetime_cols:
+            # Epoch-millisecond Float64 buffer (NaN = no date): the client
+            # filters and buckets by integer comparison instead of running
+            # new Date(string) per row per filter change
+            ms_int = s.to_numpy('datetime64[ms]').view('int64')
+            missing = s.isna().to_numpy()
+            ms = ms_int.astype('<f8')
+            ms[missing] = np.nan
+            # ISO-week bin index per row (-1 = no date), offset from the
+            # column's first week: weeks are numbered by their Thursday, and
+            # 1970-01-01 was a Thursday, so the global bucket is simply that
+            # Thursday's epoch day divided by 7. The %G-W%V labels for the
+            # whole bin range travel in the header, so trends on the client
+            # are a bincount over this Int16 column plus a label lookup — no
+            # Date math at all.
+            day = ms_int // 86_400_000
+            week = (day - (day + 3) % 7 + 3) // 7
+            if missing.all():
+                idx = np.full(len(s), -1, dtype='<i2')
+                labels = []
+            else:
+                wmin = int(week[~missing].min())
+                wmax = int(week[~missing].max())
+                idx = (week - wmin).astype('<i2')
+                idx[missing] = -1
+                labels = [
+                    pd.Timestamp((wmin + b) * 7, unit='D').strftime('%G-W%V')
+                    for b in range(wmax - wmin + 1)
+                ]
+            column_entries.append({
+                'name': col, 'kind': 'ms',
+                'offset': _append(ms.tobytes()),
+                'week_offset': _append(idx.tobytes()),
+                'weeks': labels,
+            })
+        elif col in numeric_cols:
+            # Raw little-endian Float64 buffer: one memcpy on the client.
+            # NaN round-trips, so missing values stay missing.
+            arr = s.replace([np.inf, -np.inf], np.nan).to_numpy(dtype='<f8')
+            column_entries.append({
+                'name': col, 'kind': 'num', 'offset': _append(arr.tobytes()),
+            })
+        elif isinstance(s.dtype, pd.CategoricalDtype):
+            # Dictionary encoding: the value list once (in the header), plus
+            # an Int16 code per row (-1 = missing). Group counts and filter
+            # matches on the client are integer operations.
+            codes = s.cat.codes.to_numpy(dtype='<i2')
+            column_entries.append({
+                'name': col, 'kind': 'cat',
+                'dict': s.cat.categories.tolist(),
+                'offset': _append(codes.tobytes()),
+            })
+        else:
+            # Raw strings travel in the JSON header; the client renders cell
+            # text via textContent, so no per-value HTML escaping is needed
+            string_columns[col] = s.astype(str).where(s.notna(), '').tolist()
+
+    # Row order sorted by release date with the undated rows last, plus
+    # how many rows are dated: an active date-range filter on the client
+    # then reduces to two binary searches over the sorted dates, yielding
+    # a contiguous slice of this permutation instead of a full scan
+    if 'Fecha Real de Liberación' in datetime_cols:
+        rel = subset['Fecha Real de Liberación']
+        rel_ms = rel.to_numpy('datetime64[ms]').view('int64').astype('float64')
+        rel_ms[rel.isna().to_numpy()] = np.inf
+        order = np.argsort(rel_ms, kind='stable').astype('<i4')
+        column_entries.append({
+            'name': 'release_order', 'kind': 'perm',
+            'offset': _append(order.tobytes()),
+            'n_dated': int(rel.notna().sum()),
+        })
+
+    # Packed threshold bitmaps, one bit per row in little-endian bit order
+    # and padded to whole 32-bit words: the client counts the late/>30/>60
+    # KPIs as popcounts of these words ANDed with the filter bitmap, 32
+    # rows per iteration with no branches
+    n_words = -(-len(df) // 32)
+    for name, col in (('late_bits', 'Liberación retrasada por'),
+                      ('dev_gt30_bits', 'Estado Desarrollo > 30 días'),
+                      ('devlib_gt60_bits', 'Desarrollo y liberada > 60 Días')):
+        if col not in subset.columns:
+            continue
+        # NaN compares False, so rows without data stay clear
+        flags = subset[col].to_numpy(dtype='float64') > 0
+        raw = np.packbits(flags, bitorder='little').tobytes()
+        column_entries.append({
+            'name': name, 'kind': 'bits',
+            'offset': _append(raw + b'\x00' * (n_words * 4 - len(raw))),
+        })
+
+    header = {
+        'rows': int(len(df)),
+        'columns': column_entries,
+        'strings': string_columns,
+    }
+    header_json = orjson.dumps(header)
+    # Pad the header so the payload starts on an 8-byte boundary (4-byte
+    # length word + header + padding)
+    header_json += b' ' * (-(4 + len(header_json)) % 8)
+    blob = len(header_json).to_bytes(4, 'little') + header_json + bytes(payload)
+    # mtime=0 keeps the gzip output deterministic for identical data
+    with open(DATA_FILE, 'wb') as f:
+        with gzip.GzipFile(fileobj=f, mode='wb', mtime=0) as gz:
+            gz.write(blob)
+
+    # Ship the unfiltered metrics precomputed in Python: the initial render
+    # and the reset path reuse them instead of re-reducing every row in JS
+    def _top_records(df_top, metric_col):
+        cols = ['Resumen', 'Clave', metric_col, 'Persona asignada', 'Desarrollador']
+        cols = [c for c in cols if c in df_top.columns]
+        if df_top.empty:
+            return []
+        records = df_top[cols].copy()
+        if metric_col in records.columns:
+            records[metric_col] = records[metric_col].fillna(0)
+        return records.astype(object).where(records.notna(), '').to_dict(orient='records')
+
+    initial_metrics = dict(metrics)
+    initial_metrics['top_late'] = _top_records(metrics['top_late'], 'Liberación retrasada por')
+    initial_metrics['top_dev_gt30'] = _top_records(metrics['top_dev_gt30'], 'Estado Desarrollo > 30 días')
+    initial_metrics['top_devlib_gt60'] = _top_records(metrics['top_devlib_gt60'], 'Desarrollo y liberada > 60 Días')
+    for key in ('delay_by_persona', 'delay_by_dev'):
+        # Groups with no delay data average to NaN; display expects numbers
+        initial_metrics[key] = {k: (0.0 if pd.isna(v) else float(v))
+                                for k, v in metrics[key].items()}
+    # Pre-formatted display strings alongside the numbers, so the render
+    # path never runs toFixed per bar or per KPI update
+    for key in ('delay_by_persona', 'delay_by_dev'):
+        initial_metrics[key + '_text'] = [f'{v:.1f}' for v in initial_metrics[key].values()]
+    for key in ('avg_delay', 'max_delay', 'min_delay'):
+        initial_metrics[key + '_text'] = f'{float(initial_metrics[key]):.1f}'
+    initial_metrics['pct_late_text'] = f"{float(initial_metrics['pct_late']):.1f}%"
+    # A literal '</script>' inside a string value would end the script block
+    initial_metrics_json_str = orjson.dumps(
+        initial_metrics, option=orjson.OPT_SERIALIZE_NUMPY, default=str
+    ).decode().replace('</', '<\\/')
+
+    # Extract unique values for filter dropdowns
+    # The categorical cast in preprocess_data already computed the sorted
+    # unique values: cat.categories is an attribute read, not a fresh
+    # hash-uniquify-and-sort pass per column
+    def _options(col):
+        if col not in df.columns:
+            return []
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            return s.cat.categories.tolist()
+        return sorted(s.dropna().unique().tolist())
+
+    filter_options = {col: _options(col) for col in CATEGORICAL_COLS}
+
+    def generate_options(options_list):
+        # Option values are the dictionary codes (the position in the
+        # category list mirrors the codes shipped in the columnar payload),
+        # so the client filters on integers without a label lookup
+        return ''.join([f'<option value="{code}">{html_escape(opt)}</option>'
+                        for code, opt in enumerate(options_list)])
+
+    # Get min and max dates for date filter defaults
+    min_release_date = df['Fecha Real de Liberación'].min().strftime('%Y-%m-%d') if not df['Fecha Real de Liberación'].isnull().all() else ''
+    max_release_date = df['Fecha Real de Liberación'].max().strftime('%Y-%m-%d') if not df['Fecha Real de Liberación'].isnull().all() else ''
+
+    # The same bounds as script constants, so resetFilters restores the date
+    # inputs without scanning the release column
+    date_bounds_js = (
+        ";\n        // Release-date bounds, precomputed at build time\n"
+        f"        const MIN_RELEASE_DATE = '{min_release_date}';\n"
+        f"        const MAX_RELEASE_DATE = '{max_release_date}'"
+    )
+
+    filters_html = f"""
+    <div class="section filters-section">
+        <h2>Filter Data</h2>
+        <div class="filters-grid">
+            <div class="filter-group">
+                <label for="filterEstado">Estado:</label>
+                <select id="filterEstado" onchange="scheduleFilter()">
+                    <option value="">All</option>
+                    {generate_options(filter_options['Estado'])}
+                </select>
+            </div>
+            <div class="filter-group">
+                <label for="filterPr">Prioridad:</label>
+                <select id="filterPr" onchange="scheduleFilter()">
+                    <option value="">All</option>
+                    {generate_options(filter_options['Pr'])}
+                </select>
+            </div>
+            <div class="filter-group">
+                <label for="filterTipo">Tipo:</label>
+                <select id="filterTipo" onchange="scheduleFilter()">
+                    <option value="">All</option>
+                    {generate_options(filter_options['T'])}
+                </select>
+            </div>
+            <div class="filter-group">
+                <label for="filterPersona">Persona Asignada:</label>
+                <select id="filterPersona" onchange="scheduleFilter()">
+                    <option value="">All</option>
+                    {generate_options(filter_options['Persona asignada'])}
+                </select>
+            </div>
+            <div class="filter-group">
+                <label for="filterDesarrollador">Desarrollador:</label>
+                <select id="filterDesarrollador" onchange="scheduleFilter()">
+                    <option value="">All</option>
+                    {generate_options(filter_options['Desarrollador'])}
+                </select>
+            </div>
+            <div class="filter-group">
+                <label for="startDate">Fecha Liberación (Start):</label>
+                <input type="date" id="startDate" value="{min_release_date}" onchange="scheduleFilter()">
+            </div>
+            <div class="filter-group">
+                <label for="endDate">Fecha Liberación (End):</label>
+                <input type="date" id="endDate" value="{max_release_date}" onchange="scheduleFilter()">
+            </div>
+            <button onclick="resetFilters()">Reset Filters</button>
+        </div>
+    </div>
+    """
+
+    # Cards section
+    cards_html = f"""
+    <div class="cards-row">
+      <div class="card"><div class="card-label">Total CSRs</div><div class="card-value" id="kpiTotalCSRs">{metrics['total_csrs']}</div></div>
+      <div class="card"><div class="card-label">Avg Delay (Days)</div><div class="card-value" id="kpiAvgDelay">{metrics['avg_delay']:.1f}</div></div>
+      <div class="card"><div class="card-label">% Released Late</div><div class="card-value" id="kpiPctLate">{metrics['pct_late']:.1f}%</div></div>
+      <div class="card"><div class="card-label">>30d in Dev</div><div class="card-value" id="kpiNumDevGT30">{metrics['num_dev_gt30']}</div></div>
+      <div class="card"><div class="card-label">>60d Dev→Release</div><div class="card-value" id="kpiNumDevLibGT60">{metrics['num_devlib_gt60']}</div></div>
+      <div class="card"><div class="card-label">Longest Delay (Days)</div><div class="card-value" id="kpiMaxDelay">{metrics['max_delay']:.1f}</div></div>
+      <div class="card"><div class="card-label">Shortest Delay (Days)</div><div class="card-value" id="kpiMinDelay">{metrics['min_delay']:.1f}</div></div>
+      <div class="card"><div class="card-label">Last updated</div><div class="card-value">{now}</div></div>
+    </div>
+    """
+
+    # Top delayed CSRs table
+    def make_table_html(df_top, metric_col):
+        """Generates HTML table rows straight from the top-N DataFrame's arrays."""
+        if df_top.empty:
+            return ''
+        # zip over the underlying arrays: no per-row dict allocation or
+        # .get() lookups as with to_dict(orient='records')
+        cols = ['Resumen', 'Clave', metric_col, 'Persona asignada', 'Desarrollador']
+        arrs = [df_top[c].to_numpy() if c in df_top.columns
+                else np.full(len(df_top), '', dtype=object) for c in cols]
+        rows_html = []
+        for summary, key, value, assignee, developer in zip(*arrs):
+            if isinstance(value, float):
+                value = f"{value:.1f}"
+            else:
+                value = str(value)
+            rows_html.append(
+                f"<tr><td>{html_escape(summary)}</td><td>{html_escape(key)}</td><td>{value}</td>"
+                f"<td>{html_escape(assignee)}</td><td>{html_escape(developer)}</td></tr>"
+            )
+        return ''.join(rows_html)
+
+    # Initial table data (using Python-calculated top N)
+    table_late = make_table_html(metrics['top_late'], 'Liberación retrasada por')
+    table_dev_gt30 = make_table_html(metrics['top_dev_gt30'], 'Estado Desarrollo > 30 días')
+    table_devlib_gt60 = make_table_html(metrics['top_devlib_gt60'], 'Desarrollo y liberada > 60 Días')
+
+
+    # HTML output template
+    html = ''.join([
+        _STATIC_HEAD,
+        cards_html,
+        _BETWEEN_CARDS_FILTERS,
+        filters_html,
+        _STATIC_CHARTS,
+        table_late,
+        _STATIC_TABLES_MID1,
+        table_dev_gt30,
+        _STATIC_TABLES_MID2,
+        table_devlib_gt60,
+        _STATIC_BARS,
+        _WORKER_SCRIPT,
+        _SCRIPT_PRE,
+        initial_metrics_json_str,
+        date_bounds_js,
+        _SCRIPT_TAIL,
+    ])
     with open(HTML_FILE, 'w', encoding='utf-8') as f:
         f.write(html)
-    print(f"Dashboard generated successfully at {HTML_FILE}")
+    print(f"Dashboard generated successfully at {HTML_FILE} (data in {DATA_FILE})")
+
+def _build_stamp():
+    """
+    Returns a stamp identifying the current source file and output format
+    (sha256 of the Excel bytes plus SCHEMA_VERSION), or None when the
+    source file is missing.
+    """
+    if not os.path.exists(EXCEL_FILE):
+        return None
+    with open(EXCEL_FILE, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return f'{digest}:{SCHEMA_VERSION}'
+
 
 # =============== MAIN EXECUTION ===============
 
 if __name__ == "__main__":
-    df = load_data()
-    df = preprocess_data(df)
-    metrics = get_metrics(df)
-    render_dashboard(df, metrics)
+    # Skip the whole pipeline when the outputs were already built from the
+    # same Excel bytes with the same output format
+    stamp_file = os.path.join(CACHE_DIR, 'build.stamp')
+    stamp = _build_stamp()
+    if (stamp
+            and os.path.exists(HTML_FILE) and os.path.exists(DATA_FILE)
+            and os.path.exists(stamp_file)
+            and open(stamp_file).read() == stamp):
+        print(f"Dashboard up to date for {EXCEL_FILE}; skipping regeneration")
+    else:
+        df = load_data()
+        df = preprocess_data(df)
+        metrics = get_metrics(df)
+        render_dashboard(df, metrics)
+        if stamp:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(stamp_file, 'w') as f:
+                f.write(stamp)